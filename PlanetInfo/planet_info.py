@@ -1,19 +1,37 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import os
+import pickle
+from array import array
 import inspect
 import math
+import multiprocessing
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import Counter, defaultdict
-from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, unquote
 from urllib.request import urlopen
 
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选加速依赖，缺失时退回纯 Python 实现
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时用标准库 json 编码接口响应
+    orjson = None
+
 MASK32 = 0xFFFFFFFF
 UNIVERSE_SIZE = 100
 GALAXY_SIZE = 100
@@ -32,6 +50,33 @@ PLANET_TYPES = {
     "PlanetSuperDimensional": "超维星球",
 }
 
+# 类型显示名与整数编码互查：列式存储与跨进程传输只保存 uint8 编码，显示时再查回同一个字符串对象
+STAR_TYPE_LABELS: Tuple[str, ...] = tuple(STAR_TYPES[i] for i in range(len(STAR_TYPES)))
+STAR_TYPE_CODES: Dict[str, int] = {label: i for i, label in enumerate(STAR_TYPE_LABELS)}
+PLANET_TYPE_LABELS: Tuple[str, ...] = tuple(PLANET_TYPES.values())
+PLANET_TYPE_CODES: Dict[str, int] = {label: i for i, label in enumerate(PLANET_TYPE_LABELS)}
+# 等值字符串 → 上面的规范对象；反序列化（进程池回传）得到的新副本经此换回共享对象
+TYPE_LABELS: Dict[str, str] = {label: label for label in STAR_TYPE_LABELS + PLANET_TYPE_LABELS}
+
+# MapOfStarSystemDefaultTile 的天体类型判定链：每步先 hashed_ref 一次，
+# 当 (v % modulus == 0) == when_divisible 时命中该类型；全部未命中为 PlanetOcean。
+CELESTIAL_CASCADE: Tuple[Tuple[int, bool, str], ...] = (
+    (50, False, "SpaceEmptiness"),
+    (2, False, "Asteroid"),
+    (40, True, "PlanetGaia"),
+    (40, True, "PlanetSuperDimensional"),
+    (10, True, "GasGiant"),
+    (9, True, "GasGiantRinged"),
+    (3, True, "PlanetContinental"),
+    (2, True, "PlanetMolten"),
+    (4, True, "PlanetBarren"),
+    (3, True, "PlanetArid"),
+    (2, True, "PlanetFrozen"),
+)
+CELESTIAL_NAMES: Tuple[str, ...] = tuple(name for _, _, name in CELESTIAL_CASCADE) + ("PlanetOcean",)
+# 按判定链编码标记可玩类地行星，批量扫描直接按编码筛选，不再逐格查 PLANET_TYPES
+CELESTIAL_PLAYABLE: Tuple[bool, ...] = tuple(name in PLANET_TYPES for name in CELESTIAL_NAMES)
+
 
 def u32(n: int) -> int:
     return n & MASK32
@@ -39,31 +84,67 @@ def u32(n: int) -> int:
 
 def csharp_int32(n: int) -> int:
     n &= MASK32
-    return n if n < 0x80000000 else n - 0x100000000
+    return n - ((n & 0x80000000) << 1)
 
 
 def csharp_mod(a: int, b: int) -> int:
-    return a - int(a / b) * b
+    # C# 的 % 向零取整、余数与被除数同号；纯整数实现，避免 a / b 走浮点在大数时丢精度
+    r = abs(a) % abs(b)
+    return r if a >= 0 else -r
 
 
 class HashUtility:
     @staticmethod
     def hash_uint(a: int) -> int:
-        a = u32((a ^ 61) ^ (a >> 16))
-        a = u32(a + (a << 3))
-        a = u32(a ^ (a >> 4))
-        a = u32(a * 0x27D4EB2D)
-        a = u32(a ^ (a >> 15))
-        return a
+        # 只有会溢出 32 位的步骤（首步兼容任意输入、加法、乘法）需要截断；异或/右移不会产生高位，无需再调 u32
+        a = ((a ^ 61) ^ (a >> 16)) & MASK32
+        a = (a + (a << 3)) & MASK32
+        a ^= a >> 4
+        a = (a * 0x27D4EB2D) & MASK32
+        return a ^ (a >> 15)
+
+    @staticmethod
+    def hash_string(text: Union[str, bytes]) -> int:
+        return HashUtility.hash_string_from(7, text)
 
     @staticmethod
-    def hash_string(text: str) -> int:
-        result = 7
-        for c in text:
-            result = u32(result + ord(c))
-            result = HashUtility.hash_uint(result)
+    def char_codes(text: Union[str, bytes]) -> Iterable[int]:
+        """hash_string 逐个折叠的字符码：map key 都是 ASCII，直接遍历字节省去逐字符 ord()；已是 bytes 时原样使用。"""
+        if isinstance(text, bytes):
+            return text
+        return text.encode("ascii") if text.isascii() else map(ord, text)
+
+    @staticmethod
+    def hash_string_from(result: int, text: Union[str, bytes]) -> int:
+        """从已有的 hash_string 中间状态继续折叠 text，可复用公共前缀的哈希结果。"""
+        # 内联 hash_uint，省去每字符一次函数调用
+        for c in HashUtility.char_codes(text):
+            a = (result + c) & MASK32
+            a = (a ^ 61) ^ (a >> 16)
+            a = (a + (a << 3)) & MASK32
+            a ^= a >> 4
+            a = (a * 0x27D4EB2D) & MASK32
+            result = a ^ (a >> 15)
         return result
 
+    @staticmethod
+    def hash_string_pair(first: int, second: int, text: Union[str, bytes]) -> Tuple[int, int]:
+        """用同一段文本同时推进两个 hash_string 中间状态（map key 哈希与 self index 哈希共用坐标部分）。"""
+        for c in HashUtility.char_codes(text):
+            a = (first + c) & MASK32
+            a = (a ^ 61) ^ (a >> 16)
+            a = (a + (a << 3)) & MASK32
+            a ^= a >> 4
+            a = (a * 0x27D4EB2D) & MASK32
+            first = a ^ (a >> 15)
+            a = (second + c) & MASK32
+            a = (a ^ 61) ^ (a >> 16)
+            a = (a + (a << 3)) & MASK32
+            a ^= a >> 4
+            a = (a * 0x27D4EB2D) & MASK32
+            second = a ^ (a >> 15)
+        return first, second
+
     @staticmethod
     def hashed_ref(x: int) -> Tuple[int, int]:
         x = HashUtility.hash_uint(x)
@@ -78,6 +159,44 @@ class HashUtility:
         raw = u32(offset * width + height + i + j * width)
         return HashUtility.hash_uint(raw)
 
+    @staticmethod
+    def hash_uint_vec(a: "np.ndarray") -> "np.ndarray":
+        """hash_uint 的 NumPy 版本，输入输出均为 uint32 数组，乘法/移位自然回绕即等价于 u32。"""
+        a = (a ^ np.uint32(61)) ^ (a >> np.uint32(16))
+        a = a + (a << np.uint32(3))
+        a = a ^ (a >> np.uint32(4))
+        a = a * np.uint32(0x27D4EB2D)
+        a = a ^ (a >> np.uint32(15))
+        return a
+
+    @staticmethod
+    def hash_strings_from_vec(states: "np.ndarray", texts: List[bytes]) -> "np.ndarray":
+        """hash_string_from 的 NumPy 批量版本：states[i] 为 uint32 中间状态，逐列折叠 ASCII 文本 texts[i]，已折叠完的短文本保持不变。"""
+        if not texts:
+            return states
+        lengths = np.fromiter(map(len, texts), dtype=np.intp, count=len(texts))
+        width, common = int(lengths.max()), int(lengths.min())
+        codes = np.frombuffer(b"".join(t.ljust(width, b"\0") for t in texts), dtype=np.uint8).reshape(len(texts), width)
+        codes = codes.astype(np.uint32)
+        for col in range(width):
+            folded = HashUtility.hash_uint_vec(states + codes[:, col])
+            states = folded if col < common else np.where(col < lengths, folded, states)
+        return states
+
+    @staticmethod
+    def hash_tile_grid(width: int, height: int, offset: int = 0) -> "np.ndarray":
+        """一次性计算整张地图的 hash_tile，结果按 j * width + i 平铺。"""
+        raw = HashUtility.tile_index(width * height) + np.uint32(u32(offset * width + height))
+        return HashUtility.hash_uint_vec(raw)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def tile_index(cells: int) -> "np.ndarray":
+        """只读的平铺下标 0..cells-1（uint32），各尺寸只分配一次，供整网格 hash_tile 复用。"""
+        index = np.arange(cells, dtype=np.uint32)
+        index.flags.writeable = False
+        return index
+
 
 @dataclass(frozen=True)
 class PlanetRecord:
@@ -97,6 +216,40 @@ class PlanetRecord:
     planet_size: int
     mineral_density: int
 
+    # 预加载会常驻约 8 万条记录：用 __slots__ 去掉每个实例的 __dict__（字段均无默认值，可与 frozen 共用）
+    __slots__ = tuple(__annotations__)
+
+    def to_dict(self) -> Dict[str, object]:
+        """与 asdict() 结果相同；字段都是不可变标量，省去 asdict 的逐字段递归深拷贝，字面量构造也免去逐个 getattr。"""
+        return {
+            "map_key": self.map_key,
+            "galaxy_x": self.galaxy_x,
+            "galaxy_y": self.galaxy_y,
+            "star_system_x": self.star_system_x,
+            "star_system_y": self.star_system_y,
+            "planet_x": self.planet_x,
+            "planet_y": self.planet_y,
+            "star_type": self.star_type,
+            "planet_type": self.planet_type,
+            "seconds_for_a_day": self.seconds_for_a_day,
+            "days_for_a_month": self.days_for_a_month,
+            "days_for_a_year": self.days_for_a_year,
+            "month_for_a_year": self.month_for_a_year,
+            "planet_size": self.planet_size,
+            "mineral_density": self.mineral_density,
+        }
+
+    # frozen + 手写 __slots__ 时默认的 pickle 状态恢复会触发 FrozenInstanceError，这里显式按字段顺序存取；
+    # 同时把类型名换回共享的规范字符串，进程池预加载回传的 8 万条记录不会各带一份副本
+    def __getstate__(self) -> Tuple[object, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[object, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            if name in ("star_type", "planet_type"):
+                value = TYPE_LABELS.get(value, value)
+            object.__setattr__(self, name, value)
+
 
 def parse_map_key(map_key: str) -> Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]:
     _, index = map_key.split("#", 1)
@@ -110,33 +263,93 @@ def parse_map_key(map_key: str) -> Tuple[Tuple[int, int], Tuple[int, int], Tuple
     return out[0], out[1], out[2]
 
 
+def map_key_index(coords: Iterable[Tuple[int, int]]) -> str:
+    return "".join(f"={x},{y}" for x, y in coords)
+
+
 def build_map_key(map_type: str, coords: Iterable[Tuple[int, int]]) -> str:
-    return f"Weathering.{map_type}#" + "".join(f"={x},{y}" for x, y in coords)
+    return f"Weathering.{map_type}#" + map_key_index(coords)
 
 
 def slice_self_map_key_index(map_key: str) -> str:
     return map_key[map_key.index("#"):]
 
 
+# "#" 即 self index 的公共前缀，其 hash_string 状态只需算一次
+SELF_INDEX_PREFIX_HASH = HashUtility.hash_string("#")
+
+
+# 四种地图的 map key 前缀 "Weathering.{map_type}#" 在导入时折叠一次，逐格哈希只需从该状态继续折叠坐标部分
+MAP_KEY_PREFIX_HASHES: Dict[str, int] = {
+    map_type: HashUtility.hash_string(f"Weathering.{map_type}#")
+    for map_type in ("MapOfUniverse", "MapOfGalaxy", "MapOfStarSystem", "MapOfPlanet")
+}
+UNIVERSE_HASH_I32 = csharp_int32(MAP_KEY_PREFIX_HASHES["MapOfUniverse"])
+
+
+def map_key_prefix_hash(map_type: str) -> int:
+    """map key 前缀 "Weathering.{map_type}#" 的 hash_string 状态。"""
+    prefix_hash = MAP_KEY_PREFIX_HASHES.get(map_type)
+    if prefix_hash is None:
+        prefix_hash = HashUtility.hash_string(f"Weathering.{map_type}#")
+    return prefix_hash
+
+
+def hash_map_key(map_type: str, coords: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+    """直接由坐标计算 (hash_string(map_key), hash_string(self index))，与先拼字符串再哈希逐位一致。"""
+    return HashUtility.hash_string_pair(map_key_prefix_hash(map_type), SELF_INDEX_PREFIX_HASH, map_key_index(coords))
+
+
 def is_galaxy(universe_pos: Tuple[int, int]) -> bool:
-    universe_hash = HashUtility.hash_string("Weathering.MapOfUniverse#")
-    tile_hash = HashUtility.hash_tile(universe_pos[0], universe_pos[1], UNIVERSE_SIZE, UNIVERSE_SIZE, csharp_int32(universe_hash))
+    tile_hash = HashUtility.hash_tile(universe_pos[0], universe_pos[1], UNIVERSE_SIZE, UNIVERSE_SIZE, UNIVERSE_HASH_I32)
     return tile_hash % 50 == 0
 
 
 def is_star_system(galaxy_pos: Tuple[int, int], star_pos: Tuple[int, int]) -> bool:
-    galaxy_hash = HashUtility.hash_string(build_map_key("MapOfGalaxy", [galaxy_pos]))
+    galaxy_hash = HashUtility.hash_string_from(MAP_KEY_PREFIX_HASHES["MapOfGalaxy"], map_key_index([galaxy_pos]))
     tile_hash = HashUtility.hash_tile(star_pos[0], star_pos[1], GALAXY_SIZE, GALAXY_SIZE, csharp_int32(galaxy_hash))
     return tile_hash % 200 == 0
 
 
+@lru_cache(maxsize=None)
+def _galaxy_positions() -> Tuple[Tuple[int, int], ...]:
+    """宇宙内全部星系坐标（按行优先），整张 100×100 网格只计算一次，结果与逐格 is_galaxy 一致。"""
+    if np is not None:
+        tile = HashUtility.hash_tile_grid(UNIVERSE_SIZE, UNIVERSE_SIZE, UNIVERSE_HASH_I32)
+        return tuple((idx % UNIVERSE_SIZE, idx // UNIVERSE_SIZE) for idx in np.flatnonzero(_divisible_vec(tile, 50)).tolist())
+    base = UNIVERSE_HASH_I32 * UNIVERSE_SIZE + UNIVERSE_SIZE  # hash_tile 的常量部分，同 _star_system_positions
+    return tuple(
+        (idx % UNIVERSE_SIZE, idx // UNIVERSE_SIZE)
+        for idx in range(UNIVERSE_SIZE * UNIVERSE_SIZE)
+        if HashUtility.hash_uint((base + idx) & MASK32) % 50 == 0
+    )
+
+
+def _star_system_positions(galaxy_pos: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """星系内全部恒星系坐标（按行优先），星系哈希只计算一次，结果与逐格 is_star_system 一致。"""
+    galaxy_hash_i = csharp_int32(HashUtility.hash_string_from(MAP_KEY_PREFIX_HASHES["MapOfGalaxy"], map_key_index([galaxy_pos])))
+    if np is not None:
+        tile = HashUtility.hash_tile_grid(GALAXY_SIZE, GALAXY_SIZE, galaxy_hash_i)
+        return [(idx % GALAXY_SIZE, idx // GALAXY_SIZE) for idx in np.flatnonzero(_divisible_vec(tile, 200)).tolist()]
+    # hash_tile 对固定尺寸展开：raw = (offset * w + h) + (i + j * w)，常量部分提到循环外，按平铺下标递增
+    base = galaxy_hash_i * GALAXY_SIZE + GALAXY_SIZE
+    return [
+        (idx % GALAXY_SIZE, idx // GALAXY_SIZE)
+        for idx in range(GALAXY_SIZE * GALAXY_SIZE)
+        if HashUtility.hash_uint((base + idx) & MASK32) % 200 == 0
+    ]
+
+
+@lru_cache(maxsize=4096)
 def calculate_star_type(star_system_map_key: str) -> str:
-    star_hash = HashUtility.hash_string(slice_self_map_key_index(star_system_map_key))
-    return STAR_TYPES[star_hash % 5]
+    return _star_type_from_self_hash(HashUtility.hash_string(slice_self_map_key_index(star_system_map_key)))
+
 
+def _star_type_from_self_hash(star_hash: int) -> str:
+    return STAR_TYPE_LABELS[star_hash % 5]
 
-def _star_positions(star_system_map_key: str) -> Tuple[Tuple[int, int], Optional[Tuple[int, int]]]:
-    h = HashUtility.hash_string(star_system_map_key)
+
+def _star_positions_from_hash(h: int) -> Tuple[Tuple[int, int], Optional[Tuple[int, int]]]:
     star_pos = abs(csharp_int32(h)) % (STAR_SYSTEM_SIZE * STAR_SYSTEM_SIZE)
     main = (star_pos % STAR_SYSTEM_SIZE, star_pos // STAR_SYSTEM_SIZE)
     second = abs(csharp_int32(HashUtility.hash_uint(h)))
@@ -145,89 +358,175 @@ def _star_positions(star_system_map_key: str) -> Tuple[Tuple[int, int], Optional
     return main, (second % STAR_SYSTEM_SIZE, second // STAR_SYSTEM_SIZE)
 
 
-def compute_planet_record(planet_map_key: str) -> PlanetRecord:
-    g_pos, s_pos, p_pos = parse_map_key(planet_map_key)
-    ss_map_key = build_map_key("MapOfStarSystem", [g_pos, s_pos])
-    ss_hash = HashUtility.hash_string(ss_map_key)
-    tile_hash = HashUtility.hash_tile(p_pos[0], p_pos[1], STAR_SYSTEM_SIZE, STAR_SYSTEM_SIZE, csharp_int32(ss_hash))
-
-    main_star, second_star = _star_positions(ss_map_key)
-    is_star_tile = p_pos == main_star or (second_star is not None and p_pos == second_star)
+@lru_cache(maxsize=4096)
+def _star_system_context(
+    gx: int, gy: int, sx: int, sy: int
+) -> Tuple[int, str, Tuple[int, int], Optional[Tuple[int, int]]]:
+    """恒星系级常量 (ss_hash_i32, star_type, main_star, second_star)，同一恒星系内 1024 个格子共用。"""
+    ss_hash, star_hash = hash_map_key("MapOfStarSystem", [(gx, gy), (sx, sy)])
+    main_star, second_star = _star_positions_from_hash(ss_hash)
+    return csharp_int32(ss_hash), _star_type_from_self_hash(star_hash), main_star, second_star
+
+
+@lru_cache(maxsize=4096)
+def _planet_key_prefix(gx: int, gy: int, sx: int, sy: int) -> Tuple[str, int, int]:
+    """恒星系内行星 map key 的公共部分 "Weathering.MapOfPlanet#=gx,gy=sx,sy"，及其折叠后的 (key, self index) 哈希状态。"""
+    key_state, self_state = hash_map_key("MapOfPlanet", [(gx, gy), (sx, sy)])
+    return build_map_key("MapOfPlanet", [(gx, gy), (sx, sy)]), key_state, self_state
+
+
+def _scan_star_system(
+    ss_hash_i: int, main_star: Tuple[int, int], second_star: Optional[Tuple[int, int]]
+) -> List[Tuple[int, int, int, str]]:
+    """一次扫描整个恒星系，返回全部可玩类地行星 (px, py, again, celestial)，按行优先顺序。
+
+    again = hash_uint(hash_uint(tile_hash)) 恰好是判定链第一步的值，顺带返回供自转周期使用。
+    """
+    return _scan_star_systems([(ss_hash_i, main_star, second_star)])[0]
+
+
+@lru_cache(maxsize=None)
+def _divisibility_constants(modulus: int) -> Tuple[int, int, int]:
+    """modulus = odd * 2**shift 时 _divisible_vec 用到的 (odd 模 2**32 的逆元, shift, 阈值)。"""
+    shift = (modulus & -modulus).bit_length() - 1
+    return pow(modulus >> shift, -1, 1 << 32), shift, MASK32 // modulus
+
+
+def _divisible_vec(h: "np.ndarray", modulus: int) -> "np.ndarray":
+    """uint32 数组上的 h % modulus == 0。
+
+    整除判定不需要余数：乘以奇因子的逆元后循环右移 shift 位，不超过阈值即整除（Hacker's Delight 10-17），
+    用乘法/移位代替 NumPy 逐元素的整数除法；2 的幂直接看低位。
+    """
+    inverse, shift, limit = _divisibility_constants(modulus)
+    if inverse == 1:
+        return (h & np.uint32(modulus - 1)) == 0
+    y = h * np.uint32(inverse)
+    if shift:
+        y = (y >> np.uint32(shift)) | (y << np.uint32(32 - shift))
+    return y <= np.uint32(limit)
+
+
+def _scan_star_systems(
+    systems: List[Tuple[int, Tuple[int, int], Optional[Tuple[int, int]]]]
+) -> List[List[Tuple[int, int, int, str]]]:
+    """_scan_star_system 的批量版本，systems 为 (ss_hash_i, main_star, second_star) 列表；
+    安装 numpy 时整批恒星系的 32×32 网格合成一个二维数组计算，每个星系只需一轮向量运算。
+    """
+    if np is None:
+        return [_scan_star_system_py(*system) for system in systems]
+
+    # 前两步（%50、%2）在全部网格上筛选，约 1% 的格子存活；其余判定步骤只在存活格子上向量化进行
+    cells = STAR_SYSTEM_SIZE * STAR_SYSTEM_SIZE
+    offsets = np.array([ss_hash_i for ss_hash_i, _, _ in systems], dtype=np.int64)
+    base = (offsets * STAR_SYSTEM_SIZE + STAR_SYSTEM_SIZE).astype(np.uint32)  # 超出 32 位的部分按 uint32 回绕，同 u32
+    tile = HashUtility.hash_uint_vec(base[:, None] + HashUtility.tile_index(cells))
+    again = HashUtility.hash_uint_vec(HashUtility.hash_uint_vec(tile))
+    mask = _divisible_vec(again, CELESTIAL_CASCADE[0][0])
+    h = HashUtility.hash_uint_vec(again)
+    mask &= _divisible_vec(h, CELESTIAL_CASCADE[1][0])
+    # 恒星所在格直接从掩码中剔除（第二恒星的平铺下标可能落在网格之外，此时无需处理）
+    star_tiles = [
+        (row, x + y * STAR_SYSTEM_SIZE)
+        for row, (_, main_star, second_star) in enumerate(systems)
+        for x, y in (main_star, second_star or main_star)
+        if x + y * STAR_SYSTEM_SIZE < cells
+    ]
+    if star_tiles:
+        star_rows, star_idx = zip(*star_tiles)
+        mask[list(star_rows), list(star_idx)] = False
+    rows, idx = np.nonzero(mask)
+    h = h[rows, idx]
+    codes = np.full(idx.size, len(CELESTIAL_CASCADE), dtype=np.int8)
+    undecided = np.ones(idx.size, dtype=bool)
+    for code in range(2, len(CELESTIAL_CASCADE)):
+        modulus, when_divisible, _ = CELESTIAL_CASCADE[code]
+        h = HashUtility.hash_uint_vec(h)
+        hit = undecided & (_divisible_vec(h, modulus) == when_divisible)
+        codes[hit] = code
+        undecided &= ~hit
+    playable = np.array(CELESTIAL_PLAYABLE)[codes]
+    rows, idx, codes = rows[playable], idx[playable], codes[playable]
+
+    out: List[List[Tuple[int, int, int, str]]] = [[] for _ in systems]
+    for row, i, code, again_i in zip(rows.tolist(), idx.tolist(), codes.tolist(), again[rows, idx].tolist()):
+        out[row].append((i % STAR_SYSTEM_SIZE, i // STAR_SYSTEM_SIZE, again_i, CELESTIAL_NAMES[code]))
+    return out
+
+
+def _scan_star_system_py(
+    ss_hash_i: int, main_star: Tuple[int, int], second_star: Optional[Tuple[int, int]]
+) -> List[Tuple[int, int, int, str]]:
+    """_scan_star_system 的纯 Python 实现（未安装 numpy 时使用）。"""
+    out = []
+    base = ss_hash_i * STAR_SYSTEM_SIZE + STAR_SYSTEM_SIZE  # 同 _star_system_positions，hash_tile 的常量部分
+    star_tiles = {x + y * STAR_SYSTEM_SIZE for x, y in (main_star, second_star or main_star)}
+    for idx in range(STAR_SYSTEM_SIZE * STAR_SYSTEM_SIZE):
+        if idx in star_tiles:
+            continue
+        # raw → tile_hash → hashcode → again：三轮 hash_uint 展开成直线代码
+        a = (base + idx) & MASK32
+        a = (a ^ 61) ^ (a >> 16)
+        a = (a + (a << 3)) & MASK32
+        a ^= a >> 4
+        a = (a * 0x27D4EB2D) & MASK32
+        a ^= a >> 15
+        a = (a ^ 61) ^ (a >> 16)
+        a = (a + (a << 3)) & MASK32
+        a ^= a >> 4
+        a = (a * 0x27D4EB2D) & MASK32
+        a ^= a >> 15
+        a = (a ^ 61) ^ (a >> 16)
+        a = (a + (a << 3)) & MASK32
+        a ^= a >> 4
+        a = (a * 0x27D4EB2D) & MASK32
+        again = a ^ (a >> 15)
+        if again % 50 != 0:
+            continue
+        h = HashUtility.hash_uint(again)
+        if h % 2 != 0:
+            continue
+        celestial = _classify_celestial(h, first_step=2)
+        if celestial in PLANET_TYPES:
+            out.append((idx % STAR_SYSTEM_SIZE, idx // STAR_SYSTEM_SIZE, again, celestial))
+    return out
+
+
+def _classify_celestial(hashcode: int, first_step: int = 0) -> str:
+    """hashcode 为 hash_uint(tile_hash)，按 CELESTIAL_CASCADE 逐步判定天体类型。
+
+    已手动走完前 first_step 步时，传入最后一步的值即可从第 first_step 步继续。
+    """
+    a = hashcode & MASK32
+    for modulus, when_divisible, celestial in CELESTIAL_CASCADE[first_step:]:
+        # 内联 hash_uint：判定链是逐格调用最多的路径，省去每步一次函数调用
+        a = (a ^ 61) ^ (a >> 16)
+        a = (a + (a << 3)) & MASK32
+        a ^= a >> 4
+        a = (a * 0x27D4EB2D) & MASK32
+        a ^= a >> 15
+        if (a % modulus == 0) == when_divisible:
+            return celestial
+    return "PlanetOcean"
+
+
+def _classify_tile(gx: int, gy: int, sx: int, sy: int, px: int, py: int) -> Tuple[str, int]:
+    """判定单个格子的天体类型，返回 (celestial, again)，恒星所在格为 "Star"；只做哈希判定，不构建记录也不抛异常。"""
+    ss_hash_i, _, main_star, second_star = _star_system_context(gx, gy, sx, sy)
+    hashcode = HashUtility.hash_uint(HashUtility.hash_tile(px, py, STAR_SYSTEM_SIZE, STAR_SYSTEM_SIZE, ss_hash_i))
+    again = HashUtility.hash_uint(hashcode)
+    if (px, py) == main_star or (px, py) == second_star:
+        return "Star", again
+    return _classify_celestial(hashcode), again
 
-    hashcode = HashUtility.hash_uint(tile_hash)
-    if is_star_tile:
-        celestial = "Star"
-    else:
-        hashcode, v = HashUtility.hashed_ref(hashcode)
-        if v % 50 != 0:
-            celestial = "SpaceEmptiness"
-        else:
-            hashcode, v = HashUtility.hashed_ref(hashcode)
-            if v % 2 != 0:
-                celestial = "Asteroid"
-            else:
-                hashcode, v = HashUtility.hashed_ref(hashcode)
-                if v % 40 == 0:
-                    celestial = "PlanetGaia"
-                else:
-                    hashcode, v = HashUtility.hashed_ref(hashcode)
-                    if v % 40 == 0:
-                        celestial = "PlanetSuperDimensional"
-                    else:
-                        hashcode, v = HashUtility.hashed_ref(hashcode)
-                        if v % 10 == 0:
-                            celestial = "GasGiant"
-                        else:
-                            hashcode, v = HashUtility.hashed_ref(hashcode)
-                            if v % 9 == 0:
-                                celestial = "GasGiantRinged"
-                            else:
-                                hashcode, v = HashUtility.hashed_ref(hashcode)
-                                if v % 3 == 0:
-                                    celestial = "PlanetContinental"
-                                else:
-                                    hashcode, v = HashUtility.hashed_ref(hashcode)
-                                    if v % 2 == 0:
-                                        celestial = "PlanetMolten"
-                                    else:
-                                        hashcode, v = HashUtility.hashed_ref(hashcode)
-                                        if v % 4 == 0:
-                                            celestial = "PlanetBarren"
-                                        else:
-                                            hashcode, v = HashUtility.hashed_ref(hashcode)
-                                            if v % 3 == 0:
-                                                celestial = "PlanetArid"
-                                            else:
-                                                hashcode, v = HashUtility.hashed_ref(hashcode)
-                                                celestial = "PlanetFrozen" if v % 2 == 0 else "PlanetOcean"
 
+def compute_planet_record(planet_map_key: str) -> PlanetRecord:
+    (gx, gy), (sx, sy), (px, py) = parse_map_key(planet_map_key)
+    celestial, again = _classify_tile(gx, gy, sx, sy, px, py)
     if celestial not in PLANET_TYPES:
         raise ValueError("not playable terrestrial planet")
-
-    again = HashUtility.hash_uint(HashUtility.hash_uint(tile_hash))
-    slowed = 1 + abs(csharp_mod(csharp_int32(again), 7))
-
-    planet_hash = HashUtility.hash_string(planet_map_key)
-    self_hash = HashUtility.hash_string(slice_self_map_key_index(planet_map_key))
-    days_per_month = 2 + (planet_hash % 15)
-
-    return PlanetRecord(
-        map_key=planet_map_key,
-        galaxy_x=g_pos[0],
-        galaxy_y=g_pos[1],
-        star_system_x=s_pos[0],
-        star_system_y=s_pos[1],
-        planet_x=p_pos[0],
-        planet_y=p_pos[1],
-        star_type=calculate_star_type(ss_map_key),
-        planet_type=PLANET_TYPES[celestial],
-        seconds_for_a_day=(60 * 8) // (1 + slowed),
-        days_for_a_month=days_per_month,
-        days_for_a_year=MONTH_FOR_A_YEAR * days_per_month,
-        month_for_a_year=MONTH_FOR_A_YEAR,
-        planet_size=50 + (self_hash % 100),
-        mineral_density=3 + (HashUtility.add_salt(self_hash, 2641779086) % 27),
-    )
+    star_type = _star_system_context(gx, gy, sx, sy)[1]
+    return compute_planet_record_fast(gx, gy, sx, sy, px, py, star_type, again, celestial)
 
 
 def compute_planet_record_fast(
@@ -238,60 +537,32 @@ def compute_planet_record_fast(
     px: int,
     py: int,
     star_type: str,
-    tile_hash: int,
+    again: int,
+    celestial: str,
 ) -> PlanetRecord:
-    """基于已知坐标与 tile_hash 快速构建 PlanetRecord，避免重复解析 map_key。"""
-    map_key = build_map_key("MapOfPlanet", [(gx, gy), (sx, sy), (px, py)])
-    hashcode = HashUtility.hash_uint(tile_hash)
+    """基于已知坐标、_scan_star_system 给出的 again 与类地行星类型快速构建 PlanetRecord，避免重复解析 map_key 与重复哈希。"""
+    key_prefix, key_state, self_state = _planet_key_prefix(gx, gy, sx, sy)
+    planet_index = f"={px},{py}"
+    planet_hash, self_hash = HashUtility.hash_string_pair(key_state, self_state, planet_index)
+    return _planet_record(key_prefix + planet_index, gx, gy, sx, sy, px, py, star_type, again, celestial, planet_hash, self_hash)
 
-    hashcode, v = HashUtility.hashed_ref(hashcode)
-    if v % 50 != 0:
-        raise ValueError("not playable terrestrial planet")
-    hashcode, v = HashUtility.hashed_ref(hashcode)
-    if v % 2 != 0:
-        raise ValueError("not playable terrestrial planet")
-    hashcode, v = HashUtility.hashed_ref(hashcode)
-    if v % 40 == 0:
-        celestial = "PlanetGaia"
-    else:
-        hashcode, v = HashUtility.hashed_ref(hashcode)
-        if v % 40 == 0:
-            celestial = "PlanetSuperDimensional"
-        else:
-            hashcode, v = HashUtility.hashed_ref(hashcode)
-            if v % 10 == 0:
-                celestial = "GasGiant"
-            else:
-                hashcode, v = HashUtility.hashed_ref(hashcode)
-                if v % 9 == 0:
-                    celestial = "GasGiantRinged"
-                else:
-                    hashcode, v = HashUtility.hashed_ref(hashcode)
-                    if v % 3 == 0:
-                        celestial = "PlanetContinental"
-                    else:
-                        hashcode, v = HashUtility.hashed_ref(hashcode)
-                        if v % 2 == 0:
-                            celestial = "PlanetMolten"
-                        else:
-                            hashcode, v = HashUtility.hashed_ref(hashcode)
-                            if v % 4 == 0:
-                                celestial = "PlanetBarren"
-                            else:
-                                hashcode, v = HashUtility.hashed_ref(hashcode)
-                                if v % 3 == 0:
-                                    celestial = "PlanetArid"
-                                else:
-                                    hashcode, v = HashUtility.hashed_ref(hashcode)
-                                    celestial = "PlanetFrozen" if v % 2 == 0 else "PlanetOcean"
-
-    if celestial not in PLANET_TYPES:
-        raise ValueError("not playable terrestrial planet")
 
-    again = HashUtility.hash_uint(HashUtility.hash_uint(tile_hash))
-    slowed = 1 + abs(csharp_mod(csharp_int32(again), 7))
-    planet_hash = HashUtility.hash_string(map_key)
-    self_hash = HashUtility.hash_string(slice_self_map_key_index(map_key))
+def _planet_record(
+    map_key: str,
+    gx: int,
+    gy: int,
+    sx: int,
+    sy: int,
+    px: int,
+    py: int,
+    star_type: str,
+    again: int,
+    celestial: str,
+    planet_hash: int,
+    self_hash: int,
+) -> PlanetRecord:
+    """由行星 map key 哈希与 self index 哈希推出各项属性。"""
+    slowed = 1 + abs(csharp_int32(again)) % 7  # 即 abs(csharp_mod(csharp_int32(again), 7))
     days_per_month = 2 + (planet_hash % 15)
 
     return PlanetRecord(
@@ -313,6 +584,107 @@ def compute_planet_record_fast(
     )
 
 
+def _galaxy_planet_records(
+    gx: int,
+    gy: int,
+    positions: List[Tuple[int, int]],
+    star_types: List[str],
+    scans: List[List[Tuple[int, int, int, str]]],
+) -> List[List[PlanetRecord]]:
+    """按恒星系给出整个星系的 PlanetRecord。
+
+    安装 numpy 时，全部行星 map key 坐标部分（"=px,py"）的两路字符串哈希整批向量化折叠，不再逐行星逐字符循环。
+    """
+    if np is None:
+        return [
+            [compute_planet_record_fast(gx, gy, sx, sy, px, py, star_type, again, celestial) for px, py, again, celestial in planets]
+            for (sx, sy), star_type, planets in zip(positions, star_types, scans)
+        ]
+
+    texts: List[str] = []
+    key_states: List[int] = []
+    self_states: List[int] = []
+    for (sx, sy), planets in zip(positions, scans):
+        _, key_state, self_state = _planet_key_prefix(gx, gy, sx, sy)
+        for px, py, _, _ in planets:
+            texts.append(f"={px},{py}")
+        key_states.extend(repeat(key_state, len(planets)))
+        self_states.extend(repeat(self_state, len(planets)))
+    n = len(texts)
+    encoded = [t.encode("ascii") for t in texts]
+    hashes = HashUtility.hash_strings_from_vec(np.array(key_states + self_states, dtype=np.uint32), encoded + encoded).tolist()
+
+    out: List[List[PlanetRecord]] = []
+    k = 0
+    for (sx, sy), star_type, planets in zip(positions, star_types, scans):
+        key_prefix = _planet_key_prefix(gx, gy, sx, sy)[0]
+        records = []
+        for px, py, again, celestial in planets:
+            records.append(
+                _planet_record(key_prefix + texts[k], gx, gy, sx, sy, px, py, star_type, again, celestial, hashes[k], hashes[n + k])
+            )
+            k += 1
+        out.append(records)
+    return out
+
+
+# 单恒星系扫描结果回传主进程时使用的数值列，其余字段可由坐标与 MONTH_FOR_A_YEAR 还原
+SYSTEM_SCAN_COLUMNS = ("planet_x", "planet_y", "seconds_for_a_day", "days_for_a_month", "planet_size", "mineral_density")
+
+
+def _scan_system_columns(
+    galaxy_pos: Tuple[int, int], star_pos: Tuple[int, int]
+) -> Tuple[int, array, Dict[str, array]]:
+    """进程池 worker：扫描单个恒星系，返回 (恒星类型编码, 行星类型编码, 数值列)，列数组比 PlanetRecord 列表更便于跨进程传输。"""
+    (gx, gy), (sx, sy) = galaxy_pos, star_pos
+    ss_hash_i, star_type, main_star, second_star = _star_system_context(gx, gy, sx, sy)
+    records = [
+        compute_planet_record_fast(gx, gy, sx, sy, px, py, star_type, again, celestial)
+        for px, py, again, celestial in _scan_star_system(ss_hash_i, main_star, second_star)
+    ]
+    columns = {name: array("i", [getattr(r, name) for r in records]) for name in SYSTEM_SCAN_COLUMNS}
+    return STAR_TYPE_CODES[star_type], array("B", [PLANET_TYPE_CODES[r.planet_type] for r in records]), columns
+
+
+def scan_galaxy(galaxy_pos: Tuple[int, int], workers: Optional[int] = None) -> List[PlanetRecord]:
+    """扫描整个星系的全部可玩类地行星，按恒星系（行优先）顺序返回；各恒星系互不依赖，多核时分发到进程池。"""
+    gx, gy = galaxy_pos
+    systems = _star_system_positions(galaxy_pos)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(systems) <= 1:
+        results = [_scan_system_columns(galaxy_pos, star_pos) for star_pos in systems]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_system_columns, repeat(galaxy_pos), systems, chunksize=8))
+
+    out: List[PlanetRecord] = []
+    for (sx, sy), (star_code, planet_codes, columns) in zip(systems, results):
+        star_type = STAR_TYPE_LABELS[star_code]
+        for i, planet_code in enumerate(planet_codes):
+            px, py = columns["planet_x"][i], columns["planet_y"][i]
+            days_per_month = columns["days_for_a_month"][i]
+            out.append(
+                PlanetRecord(
+                    map_key=build_map_key("MapOfPlanet", [(gx, gy), (sx, sy), (px, py)]),
+                    galaxy_x=gx,
+                    galaxy_y=gy,
+                    star_system_x=sx,
+                    star_system_y=sy,
+                    planet_x=px,
+                    planet_y=py,
+                    star_type=star_type,
+                    planet_type=PLANET_TYPE_LABELS[planet_code],
+                    seconds_for_a_day=columns["seconds_for_a_day"][i],
+                    days_for_a_month=days_per_month,
+                    days_for_a_year=MONTH_FOR_A_YEAR * days_per_month,
+                    month_for_a_year=MONTH_FOR_A_YEAR,
+                    planet_size=columns["planet_size"][i],
+                    mineral_density=columns["mineral_density"][i],
+                )
+            )
+    return out
+
+
 def verify_samples() -> None:
     samples = {
         "Weathering.MapOfPlanet#=1,4=14,93=24,31": (160, 60, 5, 12, 142, 5, "类地行星", "橙色恒星"),
@@ -335,6 +707,72 @@ def verify_samples() -> None:
             raise AssertionError(f"样例不匹配: {k}\n got={got}\n exp={expected}")
 
 
+def _type_stats(labels: Tuple[str, ...], counts: List[int]) -> Dict[str, int]:
+    # 计数按类型编码存放，仅在输出时展开为 {类型名: 数量}，省略为 0 的类型
+    return {label: n for label, n in zip(labels, counts) if n}
+
+
+class PlanetTable:
+    """预加载结果的列式（SoA）视图：行星按恒星系连续存放，第 i 个恒星系的行星位于 offsets[i]:offsets[i + 1]。
+
+    数值列为 array("i")，类型列为 array("B") 编码（见 PLANET_TYPE_LABELS / STAR_TYPE_LABELS），
+    安装 numpy 时可用 column_np() 零拷贝得到对应视图，按类型筛选即整数比较。
+    """
+
+    COLUMNS = (
+        "planet_x",
+        "planet_y",
+        "seconds_for_a_day",
+        "days_for_a_month",
+        "days_for_a_year",
+        "planet_size",
+        "mineral_density",
+    )
+
+    def __init__(self, systems: Dict[Tuple[int, int, int, int], Dict[str, object]], planets_by_key: Dict[str, PlanetRecord]) -> None:
+        self.system_keys: List[Tuple[int, int, int, int]] = list(systems)
+        self.offsets = array("i", [0])
+        self.map_keys: List[str] = []
+        self.columns: Dict[str, array] = {name: array("i") for name in self.COLUMNS}
+        planet_codes = self.columns["planet_type_code"] = array("B")
+        star_codes = self.columns["star_type_code"] = array("B")
+        for skey in self.system_keys:
+            s = systems[skey]
+            for map_key in s["planet_keys"]:
+                p = planets_by_key[map_key]
+                self.map_keys.append(map_key)
+                for name in self.COLUMNS:
+                    self.columns[name].append(getattr(p, name))
+                planet_codes.append(PLANET_TYPE_CODES[p.planet_type])
+            star_codes.extend([s["star_type_code"]] * len(s["planet_keys"]))
+            self.offsets.append(len(self.map_keys))
+
+    def __len__(self) -> int:
+        return len(self.map_keys)
+
+    def column_np(self, name: str) -> "np.ndarray":
+        col = self.columns[name]
+        return np.frombuffer(col, dtype=np.uint8 if col.typecode == "B" else np.int32)
+
+    def system_index_np(self) -> "np.ndarray":
+        """每颗行星所属恒星系在 system_keys 中的下标，可直接作为 np.bincount 的分组键。"""
+        offsets = np.frombuffer(self.offsets, dtype=np.int32)
+        return np.repeat(np.arange(len(self.system_keys)), np.diff(offsets))
+
+
+def _preload_cache_path() -> Optional[str]:
+    """预加载结果的磁盘缓存路径（本文件旁的 __pycache__ 内）。
+
+    宇宙数据完全由本模块代码决定，文件名带源码摘要，代码改动后旧缓存自然失效；拿不到源码（如打包运行）时不缓存。
+    """
+    try:
+        with open(__file__, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    except (OSError, NameError):
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__", f"planet_info_universe.{digest}.pickle")
+
+
 class UniverseService:
     def __init__(self) -> None:
         self.preloaded = False
@@ -343,10 +781,17 @@ class UniverseService:
         self.planets_by_key: Dict[str, PlanetRecord] = {}
         self.galaxies: Dict[Tuple[int, int], Dict[str, object]] = {}
         self.systems: Dict[Tuple[int, int, int, int], Dict[str, object]] = {}
+        self.planet_table: Optional[PlanetTable] = None
         self._preload_lock = threading.Lock()
         self._preload_thread: Optional[threading.Thread] = None
         self._preload_rows_done = 0
         self._preload_rows_total = UNIVERSE_SIZE
+        # 预加载期间各分块结果先暂存，完成后一次性按行序合并；这里记录已完成分块的累计数量供进度展示
+        self._preload_counts = (0, 0, 0)
+        self._list_cache: Dict[Tuple[object, ...], List[Dict[str, object]]] = {}
+        self._info_cache: Dict[Tuple[object, ...], Dict[str, object]] = {}
+        # 坐标搜索索引：每个列表一份 {(x, y): 行}，与排序无关（各排序结果共用同一批行对象）
+        self._coord_index: Dict[Tuple[object, ...], Dict[Tuple[int, int], Dict[str, object]]] = {}
 
     def ensure_preload_started(self) -> None:
         with self._preload_lock:
@@ -360,15 +805,18 @@ class UniverseService:
         progress = min(100, int((self._preload_rows_done / max(1, self._preload_rows_total)) * 100))
         if self.preloaded:
             progress = 100
+            galaxy_count, system_count, planet_count = len(self.galaxies), len(self.systems), len(self.planets_by_key)
+        else:
+            galaxy_count, system_count, planet_count = self._preload_counts
         return {
             "ready": self.preloaded,
             "preloading": self.preloading,
             "progress_percent": progress,
             "rows_done": self._preload_rows_done,
             "rows_total": self._preload_rows_total,
-            "galaxy_count": len(self.galaxies),
-            "system_count": len(self.systems),
-            "planet_count": len(self.planets_by_key),
+            "galaxy_count": galaxy_count,
+            "system_count": system_count,
+            "planet_count": planet_count,
             "preload_seconds": round(self.preload_seconds, 2),
         }
 
@@ -380,72 +828,55 @@ class UniverseService:
         chunk_systems: Dict[Tuple[int, int, int, int], Dict[str, object]] = {}
         chunk_planets: Dict[str, PlanetRecord] = {}
 
-        for gy in range(gy_start, gy_end):
-            for gx in range(UNIVERSE_SIZE):
-                if not is_galaxy((gx, gy)):
-                    continue
-                gkey = (gx, gy)
-                chunk_galaxies[gkey] = {
-                    "x": gx,
-                    "y": gy,
-                    "system_keys": [],
+        for gx, gy in _galaxy_positions():
+            if not gy_start <= gy < gy_end:
+                continue
+            gkey = (gx, gy)
+            chunk_galaxies[gkey] = {
+                "x": gx,
+                "y": gy,
+                "system_keys": [],
+                "planet_count": 0,
+                "star_type_counts": [0] * len(STAR_TYPE_LABELS),
+            }
+
+            positions = _star_system_positions((gx, gy))
+            contexts = [_star_system_context(gx, gy, sx, sy) for sx, sy in positions]
+            scans = _scan_star_systems([(ss_hash_i, main_star, second_star) for ss_hash_i, _, main_star, second_star in contexts])
+            star_types = [star_type for _, star_type, _, _ in contexts]
+            records = _galaxy_planet_records(gx, gy, positions, star_types, scans)
+            for (sx, sy), star_type, planet_records in zip(positions, star_types, records):
+                skey = (gx, gy, sx, sy)
+                chunk_galaxies[gkey]["system_keys"].append(skey)
+                star_code = STAR_TYPE_CODES[star_type]
+                chunk_galaxies[gkey]["star_type_counts"][star_code] += 1
+
+                planet_type_counts = [0] * len(PLANET_TYPE_LABELS)
+                chunk_systems[skey] = {
+                    "gx": gx,
+                    "gy": gy,
+                    "sx": sx,
+                    "sy": sy,
+                    "star_type": star_type,
+                    "star_type_code": star_code,
+                    "planet_keys": [],
                     "planet_count": 0,
-                    "star_type_counter": Counter(),
+                    "planet_type_counts": planet_type_counts,
                 }
 
-                for sy in range(GALAXY_SIZE):
-                    for sx in range(GALAXY_SIZE):
-                        if not is_star_system((gx, gy), (sx, sy)):
-                            continue
-                        ss_map_key = build_map_key("MapOfStarSystem", [(gx, gy), (sx, sy)])
-                        star_type = calculate_star_type(ss_map_key)
-
-                        skey = (gx, gy, sx, sy)
-                        chunk_galaxies[gkey]["system_keys"].append(skey)
-                        chunk_galaxies[gkey]["star_type_counter"][star_type] += 1
-
-                        chunk_systems[skey] = {
-                            "gx": gx,
-                            "gy": gy,
-                            "sx": sx,
-                            "sy": sy,
-                            "star_type": star_type,
-                            "planet_keys": [],
-                            "planet_count": 0,
-                            "planet_type_counter": Counter(),
-                        }
-
-                        ss_hash_i = csharp_int32(HashUtility.hash_string(ss_map_key))
-                        main_star, second_star = _star_positions(ss_map_key)
-
-                        for py in range(STAR_SYSTEM_SIZE):
-                            for px in range(STAR_SYSTEM_SIZE):
-                                is_star_tile = (px, py) == main_star or (second_star is not None and (px, py) == second_star)
-                                tile_hash = HashUtility.hash_tile(px, py, STAR_SYSTEM_SIZE, STAR_SYSTEM_SIZE, ss_hash_i)
-                                h = HashUtility.hash_uint(tile_hash)
-
-                                if is_star_tile:
-                                    continue
-                                h = HashUtility.hash_uint(h)
-                                if h % 50 != 0:
-                                    continue
-                                h = HashUtility.hash_uint(h)
-                                if h % 2 != 0:
-                                    continue
-
-                                try:
-                                    p = compute_planet_record_fast(gx, gy, sx, sy, px, py, star_type, tile_hash)
-                                except ValueError:
-                                    continue
-                                chunk_planets[p.map_key] = p
-                                chunk_systems[skey]["planet_keys"].append(p.map_key)
-                                chunk_systems[skey]["planet_count"] += 1
-                                chunk_systems[skey]["planet_type_counter"][p.planet_type] += 1
-                                chunk_galaxies[gkey]["planet_count"] += 1
+                for p in planet_records:
+                    chunk_planets[p.map_key] = p
+                    chunk_systems[skey]["planet_keys"].append(p.map_key)
+                    chunk_systems[skey]["planet_count"] += 1
+                    planet_type_counts[PLANET_TYPE_CODES[p.planet_type]] += 1
+                    chunk_galaxies[gkey]["planet_count"] += 1
 
         return gy_end - gy_start, chunk_galaxies, chunk_systems, chunk_planets
 
     def preload_all(self) -> None:
+        # 快速路径：预加载完成后各读接口每次调用都不再争用锁（preloaded 在数据全部就绪后才置 True）
+        if self.preloaded:
+            return
         wait_thread: Optional[threading.Thread] = None
         with self._preload_lock:
             if self.preloaded:
@@ -464,117 +895,252 @@ class UniverseService:
         self._preload_rows_done = 0
         print("[PlanetInfo] 开始预加载宇宙数据...")
 
+        cache_path = _preload_cache_path()
+        cached = self._load_preload_cache(cache_path)
+        if cached is not None:
+            self.galaxies, self.systems, self.planets_by_key = cached
+            self._preload_counts = (len(self.galaxies), len(self.systems), len(self.planets_by_key))
+            self._preload_rows_done = UNIVERSE_SIZE
+            print(f"[PlanetInfo] 已从缓存载入: {cache_path}")
+        else:
+            self.galaxies, self.systems, self.planets_by_key = self._scan_universe()
+            self._save_preload_cache(cache_path)
+
+        self.planet_table = PlanetTable(self.systems, self.planets_by_key)
+        self.preloaded = True
+        self.preloading = False
+        self._preload_thread = None
+        self.preload_seconds = time.time() - start
+        print(
+            f"[PlanetInfo] 预加载完成: 星系={len(self.galaxies)}, 恒星系={len(self.systems)}, "
+            f"行星={len(self.planets_by_key)}, 耗时={self.preload_seconds:.2f}s"
+        )
+
+    @staticmethod
+    def _load_preload_cache(
+        path: Optional[str],
+    ) -> Optional[Tuple[Dict[Tuple[int, int], Dict[str, object]], Dict[Tuple[int, int, int, int], Dict[str, object]], Dict[str, PlanetRecord]]]:
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:  # 缓存损坏或由不兼容的解释器写入：忽略并重新扫描
+            print(f"[PlanetInfo] 预加载缓存不可用，重新扫描: {e}")
+            return None
+
+    def _save_preload_cache(self, path: Optional[str]) -> None:
+        if path is None:
+            return
+        directory, name = os.path.split(path)
+        prefix = name.split(".", 1)[0] + "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump((self.galaxies, self.systems, self.planets_by_key), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            # 旧版本代码留下的缓存不会再命中，一并清理
+            for old in os.listdir(directory):
+                if old.startswith(prefix) and old != name:
+                    os.remove(os.path.join(directory, old))
+        except OSError as e:  # 目录只读等情况下只是少了缓存，不影响本次预加载
+            print(f"[PlanetInfo] 预加载缓存写入失败: {e}")
+
+    def _scan_universe(
+        self,
+    ) -> Tuple[Dict[Tuple[int, int], Dict[str, object]], Dict[Tuple[int, int, int, int], Dict[str, object]], Dict[str, PlanetRecord]]:
         cpu = os.cpu_count() or 4
         workers = max(2, min(8, cpu))
-        chunk_size = 2
-        row_ranges = [(gy, min(UNIVERSE_SIZE, gy + chunk_size)) for gy in range(0, UNIVERSE_SIZE, chunk_size)]
-
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 每行一个任务，行内星系数多（扫描耗时长）的先提交：大任务先排满各 worker，
+        # 收尾阶段剩下的都是小任务，不会只剩一个 worker 在跑一整块密集行
+        galaxies_per_row = [0] * UNIVERSE_SIZE
+        for _, gy in _galaxy_positions():
+            galaxies_per_row[gy] += 1
+        row_ranges = [(gy, gy + 1) for gy in sorted(range(UNIVERSE_SIZE), key=lambda gy: -galaxies_per_row[gy])]
+
+        # 扫描是 CPU 密集的纯计算，多核时用进程池绕开 GIL；单核时进程池只剩结果序列化开销，仍用线程池
+        executor_cls = ProcessPoolExecutor if cpu > 1 else ThreadPoolExecutor
+        chunk_results: Dict[int, Tuple[Dict, Dict, Dict]] = {}
+        with executor_cls(max_workers=workers) as executor:
             future_map = {executor.submit(self._scan_galaxy_rows, gy0, gy1): (gy0, gy1) for gy0, gy1 in row_ranges}
             for future in as_completed(future_map):
                 rows_done, row_galaxies, row_systems, row_planets = future.result()
-                self.galaxies.update(row_galaxies)
-                self.systems.update(row_systems)
-                self.planets_by_key.update(row_planets)
+                chunk_results[future_map[future][0]] = (row_galaxies, row_systems, row_planets)
+                galaxy_count, system_count, planet_count = self._preload_counts
+                self._preload_counts = (
+                    galaxy_count + len(row_galaxies),
+                    system_count + len(row_systems),
+                    planet_count + len(row_planets),
+                )
                 self._preload_rows_done += rows_done
 
                 if self._preload_rows_done % 10 == 0 or self._preload_rows_done >= UNIVERSE_SIZE:
                     pct = int(self._preload_rows_done * 100 / UNIVERSE_SIZE)
+                    galaxy_count, system_count, planet_count = self._preload_counts
                     print(
                         f"[PlanetInfo] 预加载进度: {self._preload_rows_done}/{UNIVERSE_SIZE} ({pct}%), "
-                        f"星系={len(self.galaxies)}, 恒星系={len(self.systems)}, 行星={len(self.planets_by_key)}"
+                        f"星系={galaxy_count}, 恒星系={system_count}, 行星={planet_count}"
                     )
 
-        self.preloaded = True
-        self.preloading = False
-        self._preload_thread = None
-        self.preload_seconds = time.time() - start
-        print(
-            f"[PlanetInfo] 预加载完成: 星系={len(self.galaxies)}, 恒星系={len(self.systems)}, "
-            f"行星={len(self.planets_by_key)}, 耗时={self.preload_seconds:.2f}s"
+        # 全部分块完成后按行序一次性构建三张表：插入顺序与完成先后无关，扫描途中也不会反复扩容大字典
+        ordered = [chunk_results[gy0] for gy0 in sorted(chunk_results)]
+        return (
+            dict(chain.from_iterable(galaxies.items() for galaxies, _, _ in ordered)),
+            dict(chain.from_iterable(systems.items() for _, systems, _ in ordered)),
+            dict(chain.from_iterable(planets.items() for _, _, planets in ordered)),
         )
 
     @staticmethod
     def _sort_rows(rows: List[Dict[str, object]], key: str, desc: bool) -> List[Dict[str, object]]:
         if not rows:
             return rows
-        if key not in rows[0]:
+        first = rows[0]
+        if key not in first:
             key = "x"
-        if key == "x" and "y" in rows[0]:
-            return sorted(rows, key=lambda r: (r["x"], r["y"]), reverse=desc)
-        if key == "y" and "x" in rows[0]:
-            return sorted(rows, key=lambda r: (r["y"], r["x"]), reverse=desc)
-        return sorted(rows, key=lambda r: (r[key], r.get("x", 0), r.get("y", 0)), reverse=desc)
+        # 同一列表各行字段一致，缺失的 x/y 对排序无影响，直接省略后交给 C 实现的 itemgetter 取键
+        fields = [key] + [f for f in (("y", "x") if key == "y" else ("x", "y")) if f != key and f in first]
+        return sorted(rows, key=itemgetter(*fields), reverse=desc)
+
+    def _memo_rows(self, key: Tuple[object, ...], build: Callable[[], List[Dict[str, object]]]) -> List[Dict[str, object]]:
+        """预加载完成后数据不再变化，排好序的列表按参数缓存，翻回、重复排序时直接复用。"""
+        rows = self._list_cache.get(key)
+        if rows is None:
+            rows = self._list_cache[key] = build()
+        return rows
+
+    def _memo_info(self, key: Tuple[object, ...], build: Callable[[], Dict[str, object]]) -> Dict[str, object]:
+        """详情接口的响应同样只构建一次；调用方只做序列化，不修改返回的字典。"""
+        info = self._info_cache.get(key)
+        if info is None:
+            info = self._info_cache[key] = build()
+        return info
+
+    @staticmethod
+    def paginate(rows: List[Dict[str, object]], page: int, page_size: int, max_page_size: int = 100) -> Dict[str, object]:
+        page_size = max(1, min(max_page_size, page_size))
+        total = len(rows)
+        total_pages = max(1, (total + page_size - 1) // page_size)
+        page = min(max(1, page), total_pages)
+        begin = (page - 1) * page_size
+        return {
+            "rows": rows[begin:begin + page_size],
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "total_pages": total_pages,
+        }
+
+    @staticmethod
+    def _parse_coord_search(search: str) -> Optional[Tuple[int, int]]:
+        parts = search.split(",")
+        if len(parts) != 2:
+            return None
+        try:
+            return int(parts[0].strip()), int(parts[1].strip())
+        except ValueError:
+            return None
+
+    def _filter_by_coord(self, index_key: Tuple[object, ...], rows: List[Dict[str, object]], search: str) -> List[Dict[str, object]]:
+        coord = self._parse_coord_search(search)
+        if coord is None:
+            return []
+        index = self._coord_index.get(index_key)
+        if index is None:
+            index = self._coord_index[index_key] = {(r["x"], r["y"]): r for r in rows}
+        row = index.get(coord)
+        return [] if row is None else [row]
 
     def list_galaxies(self, sort_key: str = "x", desc: bool = False, search: str = "") -> List[Dict[str, object]]:
         self.preload_all()
-        rows = [{"x": g["x"], "y": g["y"], "planet_count": g["planet_count"]} for g in self.galaxies.values()]
+        if sort_key not in ("x", "y", "planet_count"):
+            sort_key = "x"
+        rows = self._memo_rows(
+            ("galaxies", sort_key, desc),
+            lambda: self._sort_rows(
+                [{"x": g["x"], "y": g["y"], "planet_count": g["planet_count"]} for g in self.galaxies.values()],
+                sort_key,
+                desc,
+            ),
+        )
         if search:
-            try:
-                sx, sy = [int(x.strip()) for x in search.split(",")]
-                rows = [r for r in rows if r["x"] == sx and r["y"] == sy]
-            except Exception:
-                rows = []
-        return self._sort_rows(rows, sort_key, desc)
+            rows = self._filter_by_coord(("galaxies",), rows, search)
+        return rows
 
     def galaxy_info(self, gx: int, gy: int) -> Dict[str, object]:
         self.preload_all()
-        g = self.galaxies[(gx, gy)]
-        return {
-            "level": "galaxy",
-            "x": gx,
-            "y": gy,
-            "planet_count": g["planet_count"],
-            "star_type_stats": dict(g["star_type_counter"]),
-            "star_system_count": len(g["system_keys"]),
-        }
+
+        def build() -> Dict[str, object]:
+            g = self.galaxies[(gx, gy)]
+            return {
+                "level": "galaxy",
+                "x": gx,
+                "y": gy,
+                "planet_count": g["planet_count"],
+                "star_type_stats": _type_stats(STAR_TYPE_LABELS, g["star_type_counts"]),
+                "star_system_count": len(g["system_keys"]),
+            }
+
+        return self._memo_info(("galaxy", gx, gy), build)
 
     def list_systems(self, gx: int, gy: int, sort_key: str = "x", desc: bool = False, search: str = "") -> List[Dict[str, object]]:
         self.preload_all()
         g = self.galaxies[(gx, gy)]
-        rows = []
-        for skey in g["system_keys"]:
-            s = self.systems[skey]
-            rows.append({
-                "x": s["sx"],
-                "y": s["sy"],
-                "star_type": s["star_type"],
-                "planet_count": s["planet_count"],
-            })
+        if sort_key not in ("x", "y", "star_type", "planet_count"):
+            sort_key = "x"
+
+        def build() -> List[Dict[str, object]]:
+            rows = []
+            for skey in g["system_keys"]:
+                s = self.systems[skey]
+                rows.append({
+                    "x": s["sx"],
+                    "y": s["sy"],
+                    "star_type": s["star_type"],
+                    "planet_count": s["planet_count"],
+                })
+            return self._sort_rows(rows, sort_key, desc)
+
+        rows = self._memo_rows(("systems", gx, gy, sort_key, desc), build)
         if search:
-            try:
-                sx, sy = [int(x.strip()) for x in search.split(",")]
-                rows = [r for r in rows if r["x"] == sx and r["y"] == sy]
-            except Exception:
-                rows = []
-        return self._sort_rows(rows, sort_key, desc)
+            rows = self._filter_by_coord(("systems", gx, gy), rows, search)
+        return rows
 
     def system_info(self, gx: int, gy: int, sx: int, sy: int) -> Dict[str, object]:
         self.preload_all()
-        s = self.systems[(gx, gy, sx, sy)]
-        return {
-            "level": "system",
-            "gx": gx,
-            "gy": gy,
-            "x": sx,
-            "y": sy,
-            "star_type": s["star_type"],
-            "planet_count": s["planet_count"],
-            "planet_type_stats": dict(s["planet_type_counter"]),
-        }
+
+        def build() -> Dict[str, object]:
+            s = self.systems[(gx, gy, sx, sy)]
+            return {
+                "level": "system",
+                "gx": gx,
+                "gy": gy,
+                "x": sx,
+                "y": sy,
+                "star_type": s["star_type"],
+                "planet_count": s["planet_count"],
+                "planet_type_stats": _type_stats(PLANET_TYPE_LABELS, s["planet_type_counts"]),
+            }
+
+        return self._memo_info(("system", gx, gy, sx, sy), build)
 
     def list_planets(self, gx: int, gy: int, sx: int, sy: int, sort_key: str = "planet_x", desc: bool = False) -> List[Dict[str, object]]:
         self.preload_all()
         s = self.systems[(gx, gy, sx, sy)]
-        rows = [asdict(self.planets_by_key[k]) for k in s["planet_keys"]]
-        if rows and sort_key not in rows[0]:
+        if sort_key not in PlanetRecord.__dataclass_fields__:
             sort_key = "planet_x"
-        rows = sorted(rows, key=lambda x: x[sort_key], reverse=desc)
-        return rows
+        return self._memo_rows(
+            ("planets", gx, gy, sx, sy, sort_key, desc),
+            lambda: sorted(
+                (self.planets_by_key[k].to_dict() for k in s["planet_keys"]),
+                key=lambda x: x[sort_key],
+                reverse=desc,
+            ),
+        )
 
     def planet_info(self, map_key: str) -> Dict[str, object]:
         self.preload_all()
-        return asdict(self.planets_by_key[map_key])
+        return self._memo_info(("planet", map_key), self.planets_by_key[map_key].to_dict)
 
     def app_info(self) -> Dict[str, object]:
         self.preload_all()
@@ -585,6 +1151,41 @@ class UniverseService:
             "preload_seconds": round(self.preload_seconds, 2),
         }
 
+    @staticmethod
+    def _system_ranking_sums(table: PlanetTable) -> Iterable[Tuple[int, Tuple[int, int, int, int], int, int, float]]:
+        """逐个非空恒星系给出 (下标, skey, Σsize², Σmineral, Σ单星评分)。
+
+        安装 numpy 时用 np.bincount 按恒星系分组求和；bincount 按输入顺序逐个累加，浮点结果与逐行累加一致。
+        """
+        sizes = table.columns["planet_size"]
+        minerals = table.columns["mineral_density"]
+        if np is None:
+            for i, skey in enumerate(table.system_keys):
+                lo, hi = table.offsets[i], table.offsets[i + 1]
+                if lo == hi:
+                    continue
+                single_planet_score_sum = 0.0
+                for size, mineral in zip(sizes[lo:hi], minerals[lo:hi]):
+                    abundance = max(mineral, 1.000000001)
+                    single_planet_score_sum += size * size / ((abundance - 1) ** 2.5)
+                yield i, skey, sum(v * v for v in sizes[lo:hi]), sum(minerals[lo:hi]), single_planet_score_sum
+            return
+
+        n = len(table.system_keys)
+        system_index = table.system_index_np()
+        size = table.column_np("planet_size").astype(np.int64)
+        mineral = table.column_np("mineral_density")
+        area = size * size
+        # 矿物稀疏度只有几十种取值：分母按取值用 Python 的 ** 算好再查表（NumPy 的向量化 pow 个别取值与 libm 差 1 ulp）
+        values, inverse = np.unique(mineral, return_inverse=True)
+        denom = np.array([(max(v, 1.000000001) - 1) ** 2.5 for v in values.tolist()])[inverse]
+        area_sums = np.bincount(system_index, weights=area, minlength=n).astype(np.int64).tolist()
+        mineral_sums = np.bincount(system_index, weights=mineral, minlength=n).astype(np.int64).tolist()
+        score_sums = np.bincount(system_index, weights=area / denom, minlength=n).tolist()
+        for i, skey in enumerate(table.system_keys):
+            if table.offsets[i] != table.offsets[i + 1]:
+                yield i, skey, area_sums[i], mineral_sums[i], score_sums[i]
+
     def list_system_rankings(
         self,
         sort_key: str = "overall_area",
@@ -593,25 +1194,39 @@ class UniverseService:
         page_size: int = 25,
     ) -> Dict[str, object]:
         self.preload_all()
+        valid_keys = {"overall_area", "avg_mineral_density", "score_v", "planet_count", "gx", "gy", "sx", "sy"}
+        if sort_key not in valid_keys:
+            sort_key = "overall_area"
+
+        if desc is None:
+            desc = sort_key != "avg_mineral_density"
+
+        rows = self._memo_rows(
+            ("system_rankings", sort_key, desc),
+            lambda: sorted(
+                self._memo_rows(("system_rankings",), self._build_system_ranking_rows),
+                key=lambda r: (r[sort_key], r["gx"], r["gy"], r["sx"], r["sy"]),
+                reverse=desc,
+            ),
+        )
+
+        result = self.paginate(rows, page, page_size)
+        result["sort_key"] = sort_key
+        result["desc"] = desc
+        return result
+
+    def _build_system_ranking_rows(self) -> List[Dict[str, object]]:
+        """全部非空恒星系的排行指标（未排序），数据在预加载后不变，由 list_system_rankings 缓存。"""
         rows: List[Dict[str, object]] = []
         threshold_t = 50
 
-        for s in self.systems.values():
-            planets = [self.planets_by_key[k] for k in s["planet_keys"]]
-            if not planets:
-                continue
-
-            overall_area = sum(p.planet_size**2 for p in planets)
-            avg_mineral_density = sum(p.mineral_density for p in planets) / len(planets)
-            planet_count = len(planets)
+        table = self.planet_table
+        for i, skey, overall_area, mineral_sum, single_planet_score_sum in self._system_ranking_sums(table):
+            s = self.systems[skey]
+            planet_count = table.offsets[i + 1] - table.offsets[i]
+            avg_mineral_density = mineral_sum / planet_count
             avg_area = overall_area / planet_count
 
-            single_planet_score_sum = 0.0
-            for p in planets:
-                planet_area = p.planet_size**2
-                abundance = max(p.mineral_density, 1.000000001)
-                single_planet_score_sum += planet_area / ((abundance - 1) ** 2.5)
-
             system_weight = math.sqrt(planet_count) / math.log2((avg_area / threshold_t) + 2)
             score_v = single_planet_score_sum * system_weight * 0.1
             rows.append(
@@ -628,39 +1243,10 @@ class UniverseService:
                     "single_planet_score_sum": round(single_planet_score_sum, 4),
                     "system_weight": round(system_weight, 4),
                     "score_v": round(score_v, 4),
-                    "planet_type_stats": dict(s["planet_type_counter"]),
+                    "planet_type_stats": _type_stats(PLANET_TYPE_LABELS, s["planet_type_counts"]),
                 }
             )
-
-        valid_keys = {"overall_area", "avg_mineral_density", "score_v", "planet_count", "gx", "gy", "sx", "sy"}
-        if sort_key not in valid_keys:
-            sort_key = "overall_area"
-
-        if desc is None:
-            desc = sort_key != "avg_mineral_density"
-
-        rows = sorted(
-            rows,
-            key=lambda r: (r[sort_key], r["gx"], r["gy"], r["sx"], r["sy"]),
-            reverse=desc,
-        )
-
-        page = max(1, page)
-        page_size = max(1, min(100, page_size))
-        total = len(rows)
-        total_pages = max(1, (total + page_size - 1) // page_size)
-        page = min(page, total_pages)
-        begin = (page - 1) * page_size
-        end = begin + page_size
-        return {
-            "rows": rows[begin:end],
-            "page": page,
-            "page_size": page_size,
-            "total": total,
-            "total_pages": total_pages,
-            "sort_key": sort_key,
-            "desc": desc,
-        }
+        return rows
 
 
 HTML = """<!doctype html>
@@ -715,6 +1301,8 @@ HTML = """<!doctype html>
     .toolbar-search { flex:1 1 88px; min-width:88px; }
     .node { padding:11px 12px; border-radius:10px; border:1px solid #4b4b4b; margin-bottom:8px; cursor:pointer; background:#1a1a1a; transition:.18s ease; }
     .node:hover { background:#2a2a2a; border-color:#777; transform:translateY(-1px); }
+    #list { position:relative; }
+    #list .node { position:absolute; left:0; right:0; height:42px; line-height:18px; margin:0; white-space:nowrap; overflow:hidden; text-overflow:ellipsis; transition:background .18s ease, border-color .18s ease, transform .18s ease; }
     .rank-node { position:relative; padding-right:20px; }
     .rank-meta { color:#bdbdbd; font-size:12px; margin-top:4px; }
     .rank-link-btn { background:none; border:none; color:#f2f2f2; text-decoration:underline; cursor:pointer; padding:0; font:inherit; }
@@ -783,7 +1371,11 @@ HTML = """<!doctype html>
       <h3 class="title">恒星系综合排行（全宇宙）</h3>
       <div class="toolbar" style="grid-template-columns:auto auto auto auto 1fr;">
         <span class="hint">排序：</span>
-        <fluent-select id="rankSortKey" style="width:220px"></fluent-select>
+        <fluent-select id="rankSortKey" style="width:220px">
+          <fluent-option value="score_v">综合</fluent-option>
+          <fluent-option value="avg_mineral_density">矿物稀疏度</fluent-option>
+          <fluent-option value="overall_area">总面积</fluent-option>
+        </fluent-select>
         <button id="rankSortDirBtn" class="btn-icon" title="切换升降序"><i id="rankSortDirIcon" class="bi bi-sort-up-alt"></i></button>
         <button id="rankRefreshBtn" class="btn-icon">刷新</button>
         <span id="rankSortDesc" class="hint"></span>
@@ -801,6 +1393,48 @@ HTML = """<!doctype html>
   </section>
 </div>
 
+<!-- 具体信息面板骨架：renderInfo 克隆后按 data-field 填入文本 -->
+<template id="tplInfoGalaxy">
+  <div class='kv'><b>当前层级:</b> 星系</div>
+  <div class='kv'><b>坐标:</b> <span data-field="coord"></span></div>
+  <div class='kv'><b>恒星系数量:</b> <span data-field="star_system_count"></span></div>
+  <div class='kv'><b>星球数量:</b> <span data-field="planet_count"></span></div>
+  <div class='kv'><b>恒星类型统计:</b><br><span data-field="stats"></span></div>
+</template>
+<template id="tplInfoSystem">
+  <div class='kv'><b>当前层级:</b> 恒星系</div>
+  <div class='kv'><b>坐标:</b> <span data-field="coord"></span></div>
+  <div class='kv'><b>恒星类型:</b> <span data-field="star_type"></span></div>
+  <div class='kv'><b>星球数量:</b> <span data-field="planet_count"></span></div>
+  <div class='kv'><b>行星类型统计:</b><br><span data-field="stats"></span></div>
+</template>
+<template id="tplInfoPlanet">
+  <div class='kv'><b>当前层级:</b> 行星</div>
+  <div class='kv'><b>MapKey:</b> <span data-field="map_key"></span></div>
+  <div class='kv'><b>坐标:</b> <span data-field="coord"></span></div>
+  <div class='kv'><b>恒星类型:</b> <span data-field="star_type"></span></div>
+  <div class='kv'><b>行星类型:</b> <span data-field="planet_type"></span></div>
+  <div class='kv'><b>昼夜周期(秒):</b> <span data-field="seconds_for_a_day"></span></div>
+  <div class='kv'><b>月份天数:</b> <span data-field="days_for_a_month"></span></div>
+  <div class='kv'><b>年份天数:</b> <span data-field="days_for_a_year"></span></div>
+  <div class='kv'><b>星球大小:</b> <span data-field="planet_size"></span></div>
+  <div class='kv'><b>矿物稀疏度:</b> <span data-field="mineral_density"></span></div>
+</template>
+<template id="tplRankNode">
+  <div class="node rank-node">
+    <div><b class='rank-no'></b> <button class='rank-link-btn' data-field="location"></button> · <span data-field="star_type"></span></div>
+    <div class='rank-meta'>综合=<span data-field="score_v"></span> · 矿物稀疏度=<span data-field="avg_mineral_density"></span> · 总面积=<span data-field="overall_area"></span> · 行星数=<span data-field="planet_count"></span></div>
+  </div>
+</template>
+<template id="tplRankHover">
+  <div><b>位置</b>：<span data-field="location"></span></div>
+  <div><b>恒星</b>：<span data-field="star_type"></span></div>
+  <div><b>组成</b>：<span data-field="stats"></span></div>
+  <div><b>总面积</b>：<span data-field="overall_area"></span></div>
+  <div><b>平均矿物丰度</b>：<span data-field="avg_mineral_density"></span></div>
+  <div><b>综合评分</b>：<span data-field="score_v"></span></div>
+</template>
+
 <script>
 const API = '/api';
 const appRoot = document.getElementById('app');
@@ -808,6 +1442,13 @@ const loadingOverlay = document.getElementById('loadingOverlay');
 const loadingStats = document.getElementById('loadingStats');
 const loadingBar = document.getElementById('loadingBar');
 const info = document.getElementById('info');
+const tplInfoGalaxy = document.getElementById('tplInfoGalaxy');
+const tplInfoSystem = document.getElementById('tplInfoSystem');
+const tplInfoPlanet = document.getElementById('tplInfoPlanet');
+const tplRankNode = document.getElementById('tplRankNode');
+const tplRankHover = document.getElementById('tplRankHover');
+// 排行数值统一用一个格式化器（千分位、最多 4 位小数）
+const numberFormat = new Intl.NumberFormat('zh-CN', { maximumFractionDigits: 4 });
 const list = document.getElementById('list');
 const breadcrumb = document.getElementById('breadcrumb');
 const sortKey = document.getElementById('sortKey');
@@ -826,6 +1467,28 @@ const rankHoverPanel = document.getElementById('rankHoverPanel');
 const navDivider = document.getElementById('navDivider');
 const searchBlock = document.getElementById('searchBlock');
 const forceReady = new URLSearchParams(window.location.search).get('ready') === '1';
+const navSide = list.parentElement;
+
+// 导航列表虚拟滚动：只渲染可视区域附近的行，节点复用
+const LIST_ITEM_H = 50;
+const LIST_OVERSCAN = 6;
+// 列表接口分页拉取：先取首页，滚动接近已加载末尾时再取下一页
+const LIST_PAGE_SIZE = 200;
+const listPool = [];
+let listRows = [];
+let listTotal = 0;
+let listPageUrl = '';
+let listNextPage = 1;
+let listPageLoading = false;
+let listRowText = null;
+let listRowClick = null;
+// 列表请求序号：每次显示提示/发起加载都会递增，连续切换层级/排序时只有最后一次请求的结果会写入列表
+let listLoadSeq = 0;
+
+// 排行列表按恒星系坐标复用节点：翻页/换排序时只增删变化的行，保留的行仅移动位置
+let rankNodes = new Map();
+// 排行分页缓存：数据由坐标哈希确定、预加载后不再变化，看过/预取过的页直接复用，无需重新请求
+const rankPageCache = new Map();
 
 let state = {
   tab: 'nav',
@@ -847,12 +1510,93 @@ function defaultRankDesc(sortKey){
   return sortKey !== 'avg_mineral_density';
 }
 
+function setListRows(rows, total, rowText, onRowClick){
+  listRows = rows;
+  listTotal = total;
+  listRowText = rowText;
+  listRowClick = onRowClick;
+  list.innerHTML = '';
+  list.style.height = `${total * LIST_ITEM_H}px`;
+  navSide.scrollTop = 0;
+  renderListWindow();
+}
+
+async function openPagedList(url, seq, rowText, onRowClick){
+  const data = await getJson(`${url}&page=1&page_size=${LIST_PAGE_SIZE}`);
+  if (seq !== listLoadSeq) return;
+  listPageUrl = url;
+  listNextPage = 2;
+  setListRows(data.rows, data.total, rowText, onRowClick);
+}
+
+async function loadMoreListRows(){
+  if (listPageLoading || listRows.length >= listTotal) return;
+  const seq = listLoadSeq;
+  listPageLoading = true;
+  try {
+    const data = await getJson(`${listPageUrl}&page=${listNextPage}&page_size=${LIST_PAGE_SIZE}`);
+    if (seq !== listLoadSeq) return;
+    listNextPage++;
+    listRows.push(...data.rows);
+    renderListWindow();
+  } finally {
+    if (seq === listLoadSeq) listPageLoading = false;
+  }
+}
+
+function showListHint(text){
+  listLoadSeq++;
+  listRows = [];
+  listTotal = 0;
+  listPageLoading = false;
+  list.style.height = '';
+  list.innerHTML = `<div class="hint">${text}</div>`;
+}
+
+function renderListWindow(){
+  if (!listRows.length) return;
+  const offset = list.getBoundingClientRect().top - navSide.getBoundingClientRect().top;
+  const start = Math.max(0, Math.floor(-offset / LIST_ITEM_H) - LIST_OVERSCAN);
+  let end = Math.min(listTotal, Math.ceil((navSide.clientHeight - offset) / LIST_ITEM_H) + LIST_OVERSCAN);
+  if (end > listRows.length) {
+    loadMoreListRows();
+    end = listRows.length;
+  }
+  // 需要（重新）挂载的节点先收集到 fragment，最后一次性插入，避免逐个 appendChild 触发多次布局
+  const fresh = document.createDocumentFragment();
+  let used = 0;
+  for (let i = start; i < end; i++, used++){
+    let div = listPool[used];
+    if (!div) {
+      div = document.createElement('div');
+      div.className = 'node';
+      listPool.push(div);
+    }
+    if (div.parentNode !== list) fresh.appendChild(div);
+    const r = listRows[i];
+    div.style.top = `${i * LIST_ITEM_H}px`;
+    div.textContent = listRowText(r);
+    div.dataset.idx = i;
+  }
+  if (fresh.firstChild) list.appendChild(fresh);
+  for (let i = used; i < listPool.length; i++) listPool[i].remove();
+}
+
+// 排序指示只在状态变化时写 DOM（每次翻页、刷新都会调用）
+let lastSortDesc = null;
+let lastRankSortState = '';
+
 function setSortIndicator(){
+  if (lastSortDesc === state.desc) return;
+  lastSortDesc = state.desc;
   sortDirIcon.className = state.desc ? 'bi bi-sort-up-alt' : 'bi bi-sort-down-alt';
   sortLabel.textContent = state.desc ? '降序' : '升序';
 }
 
 function setRankSortIndicator(){
+  const rankSortState = `${state.rank.sort_key}|${state.rank.desc}`;
+  if (lastRankSortState === rankSortState) return;
+  lastRankSortState = rankSortState;
   rankSortDirIcon.className = state.rank.desc ? 'bi bi-sort-up-alt' : 'bi bi-sort-down-alt';
   rankSortDesc.textContent = state.rank.sort_key === 'avg_mineral_density'
     ? `当前${state.rank.desc ? '降序（高密度优先）' : '升序（低密度优先）'}`
@@ -866,22 +1610,32 @@ function switchTab(tab){
   tabRank.classList.toggle('active', !navActive);
   navView.classList.toggle('active', navActive);
   rankView.classList.toggle('active', !navActive);
+  if (navActive) renderListWindow();
 }
 
-function setSortOptions(level){
-  sortKey.innerHTML = '';
-  const keys = level === 'galaxy'
-    ? ['x','y','planet_count']
-    : level === 'system'
-    ? ['x','y','planet_count']
-    : ['planet_x','planet_y','planet_size','mineral_density','seconds_for_a_day'];
-  for (const k of keys){
+// 各层级的排序选项节点只创建一次（星系/恒星系共用一组），切换层级时整组换入，
+// 不再重复 createElement 与自定义元素升级
+const coordSortOptions = createSortOptions(['x','y','planet_count']);
+const SORT_OPTIONS = {
+  galaxy: coordSortOptions,
+  system: coordSortOptions,
+  planet: createSortOptions(['planet_x','planet_y','planet_size','mineral_density','seconds_for_a_day']),
+};
+
+function createSortOptions(keys){
+  return keys.map(k => {
+    // 此时 Fluent 组件脚本（module，延后执行）可能尚未注册，用 setAttribute 写 value 特性
     const o = document.createElement('fluent-option');
-    o.value = k;
+    o.setAttribute('value', k);
     o.textContent = k;
-    sortKey.appendChild(o);
-  }
-  if (!keys.includes(state.sort_key)) state.sort_key = keys[0];
+    return o;
+  });
+}
+
+function setSortOptions(level){
+  const options = SORT_OPTIONS[level] || SORT_OPTIONS.planet;
+  if (sortKey.firstElementChild !== options[0]) sortKey.replaceChildren(...options);
+  if (!options.some(o => o.getAttribute('value') === state.sort_key)) state.sort_key = options[0].getAttribute('value');
   sortKey.value = state.sort_key;
 }
 
@@ -894,41 +1648,65 @@ function parseCoordInput(raw){
   return {x, y};
 }
 
+function statPills(stats){
+  const frag = document.createDocumentFragment();
+  for (const [k, v] of Object.entries(stats || {})) {
+    const pill = document.createElement('span');
+    pill.className = 'pill';
+    pill.textContent = `${k}: ${v}`;
+    frag.appendChild(pill);
+  }
+  if (!frag.firstChild) frag.appendChild(document.createTextNode('无'));
+  return frag;
+}
+
 function renderInfo(data){
+  let tpl, fields;
   if (data.level === 'galaxy') {
-    const starStats = Object.entries(data.star_type_stats).map(([k,v])=>`<span class='pill'>${k}: ${v}</span>`).join('');
-    info.innerHTML = `
-      <div class='kv'><b>当前层级:</b> 星系</div>
-      <div class='kv'><b>坐标:</b> (${data.x}, ${data.y})</div>
-      <div class='kv'><b>恒星系数量:</b> ${data.star_system_count}</div>
-      <div class='kv'><b>星球数量:</b> ${data.planet_count}</div>
-      <div class='kv'><b>恒星类型统计:</b><br>${starStats || '无'}</div>
-    `;
+    tpl = tplInfoGalaxy;
+    fields = {
+      coord: `(${data.x}, ${data.y})`,
+      star_system_count: data.star_system_count,
+      planet_count: data.planet_count,
+      stats: statPills(data.star_type_stats),
+    };
   } else if (data.level === 'system') {
-    const pStats = Object.entries(data.planet_type_stats).map(([k,v])=>`<span class='pill'>${k}: ${v}</span>`).join('');
-    info.innerHTML = `
-      <div class='kv'><b>当前层级:</b> 恒星系</div>
-      <div class='kv'><b>坐标:</b> 星系(${data.gx}, ${data.gy}) / 恒星系(${data.x}, ${data.y})</div>
-      <div class='kv'><b>恒星类型:</b> ${data.star_type}</div>
-      <div class='kv'><b>星球数量:</b> ${data.planet_count}</div>
-      <div class='kv'><b>行星类型统计:</b><br>${pStats || '无'}</div>
-    `;
+    tpl = tplInfoSystem;
+    fields = {
+      coord: `星系(${data.gx}, ${data.gy}) / 恒星系(${data.x}, ${data.y})`,
+      star_type: data.star_type,
+      planet_count: data.planet_count,
+      stats: statPills(data.planet_type_stats),
+    };
   } else {
-    info.innerHTML = `
-      <div class='kv'><b>当前层级:</b> 行星</div>
-      <div class='kv'><b>MapKey:</b> ${data.map_key}</div>
-      <div class='kv'><b>坐标:</b> 星系(${data.galaxy_x},${data.galaxy_y}) / 恒星系(${data.star_system_x},${data.star_system_y}) / 行星(${data.planet_x},${data.planet_y})</div>
-      <div class='kv'><b>恒星类型:</b> ${data.star_type}</div>
-      <div class='kv'><b>行星类型:</b> ${data.planet_type}</div>
-      <div class='kv'><b>昼夜周期(秒):</b> ${data.seconds_for_a_day}</div>
-      <div class='kv'><b>月份天数:</b> ${data.days_for_a_month}</div>
-      <div class='kv'><b>年份天数:</b> ${data.days_for_a_year}</div>
-      <div class='kv'><b>星球大小:</b> ${data.planet_size}</div>
-      <div class='kv'><b>矿物稀疏度:</b> ${data.mineral_density}</div>
-    `;
+    tpl = tplInfoPlanet;
+    fields = {
+      ...data,
+      coord: `星系(${data.galaxy_x},${data.galaxy_y}) / 恒星系(${data.star_system_x},${data.star_system_y}) / 行星(${data.planet_x},${data.planet_y})`,
+    };
+  }
+  info.replaceChildren(cloneTemplate(tpl, fields));
+}
+
+// 克隆预解析的模板，只写 textContent，不再每次经过 HTML 解析
+function cloneTemplate(tpl, fields){
+  const node = tpl.content.cloneNode(true);
+  fillFields(node, fields);
+  return node;
+}
+
+function fillFields(root, fields){
+  for (const slot of root.querySelectorAll('[data-field]')) {
+    const v = fields[slot.dataset.field];
+    if (v instanceof Node) slot.replaceChildren(v);
+    else slot.textContent = v;
   }
 }
 
+function apiUrl(path, params){
+  return `${API}/${path}?${new URLSearchParams(params)}`;
+}
+
 async function getJson(url){
   const r = await fetch(url);
   if (!r.ok) throw new Error(await r.text());
@@ -936,65 +1714,51 @@ async function getJson(url){
 }
 
 async function loadList(search=''){
-  list.innerHTML = '<div class="hint">加载中...</div>';
+  showListHint('加载中...');
+  const seq = listLoadSeq;
 
   if (state.level === 'galaxy') {
     breadcrumb.textContent = '宇宙 / 星系列表';
-    const rows = await getJson(`${API}/galaxies?sort_key=${state.sort_key}&desc=${state.desc?1:0}&search=${encodeURIComponent(search)}`);
-    list.innerHTML = '';
-    for (const r of rows){
-      const div = document.createElement('div');
-      div.className = 'node';
-      div.textContent = `星系 ${r.x},${r.y} · 星球 ${r.planet_count}`;
-      div.onclick = async ()=>{
-        state.level = 'system';
-        state.gx = r.x; state.gy = r.y;
-        state.sort_key = 'x';
-        setSortOptions('system');
-        renderInfo(await getJson(`${API}/galaxy_info?gx=${r.x}&gy=${r.y}`));
-        await loadList('');
-      };
-      list.appendChild(div);
-    }
+    await openPagedList(apiUrl('galaxies', {sort_key: state.sort_key, desc: state.desc?1:0, search}), seq, r => `星系 ${r.x},${r.y} · 星球 ${r.planet_count}`, async r => {
+      state.level = 'system';
+      state.gx = r.x; state.gy = r.y;
+      state.sort_key = 'x';
+      setSortOptions('system');
+      renderInfo(await getJson(apiUrl('galaxy_info', {gx: r.x, gy: r.y})));
+      await loadList('');
+    });
     return;
   }
 
   if (state.level === 'system') {
     breadcrumb.textContent = `宇宙 / 星系(${state.gx},${state.gy}) / 恒星系列表`;
-    const rows = await getJson(`${API}/systems?gx=${state.gx}&gy=${state.gy}&sort_key=${state.sort_key}&desc=${state.desc?1:0}&search=${encodeURIComponent(search)}`);
-    list.innerHTML = '';
-    for (const r of rows){
-      const div = document.createElement('div');
-      div.className = 'node';
-      div.textContent = `恒星系 ${r.x},${r.y} · ${r.star_type} · 星球 ${r.planet_count}`;
-      div.onclick = async ()=>{
-        state.level = 'planet';
-        state.sx = r.x; state.sy = r.y;
-        state.sort_key = 'planet_x';
-        setSortOptions('planet');
-        renderInfo(await getJson(`${API}/system_info?gx=${state.gx}&gy=${state.gy}&sx=${r.x}&sy=${r.y}`));
-        await loadList('');
-      };
-      list.appendChild(div);
-    }
+    await openPagedList(apiUrl('systems', {gx: state.gx, gy: state.gy, sort_key: state.sort_key, desc: state.desc?1:0, search}), seq, r => `恒星系 ${r.x},${r.y} · ${r.star_type} · 星球 ${r.planet_count}`, async r => {
+      state.level = 'planet';
+      state.sx = r.x; state.sy = r.y;
+      state.sort_key = 'planet_x';
+      setSortOptions('planet');
+      renderInfo(await getJson(apiUrl('system_info', {gx: state.gx, gy: state.gy, sx: r.x, sy: r.y})));
+      await loadList('');
+    });
     return;
   }
 
   breadcrumb.textContent = `宇宙 / 星系(${state.gx},${state.gy}) / 恒星系(${state.sx},${state.sy}) / 行星列表`;
-  const rows = await getJson(`${API}/planets?gx=${state.gx}&gy=${state.gy}&sx=${state.sx}&sy=${state.sy}&sort_key=${state.sort_key}&desc=${state.desc?1:0}`);
-  list.innerHTML = '';
-  for (const p of rows){
-    const div = document.createElement('div');
-    div.className = 'node';
-    div.textContent = `行星 ${p.planet_x},${p.planet_y} · ${p.planet_type} · 大小 ${p.planet_size}`;
-    div.onclick = ()=> renderInfo(p);
-    list.appendChild(div);
-  }
+  await openPagedList(apiUrl('planets', {gx: state.gx, gy: state.gy, sx: state.sx, sy: state.sy, sort_key: state.sort_key, desc: state.desc?1:0}), seq, p => `行星 ${p.planet_x},${p.planet_y} · ${p.planet_type} · 大小 ${p.planet_size}`, p => renderInfo(p));
 }
 
+// 只取数量最多的 4 项：插入到最多 4 个元素的有序数组，不对全部条目排序；同数量时保持原顺序
 function formatStats(stats){
-  const parts = Object.entries(stats || {}).sort((a,b)=>b[1]-a[1]).slice(0,4).map(([k,v])=>`${k}:${v}`);
-  return parts.join(' · ') || '无';
+  const top = [];
+  for (const k in stats) {
+    const v = stats[k];
+    let i = top.length;
+    while (i > 0 && top[i - 1][1] < v) i--;
+    if (i >= 4) continue;
+    top.splice(i, 0, [k, v]);
+    if (top.length > 4) top.pop();
+  }
+  return top.map(([k, v])=>`${k}:${v}`).join(' · ') || '无';
 }
 
 function updateRankHoverPanelPosition(event){
@@ -1009,15 +1773,31 @@ function updateRankHoverPanelPosition(event){
   rankHoverPanel.style.top = `${Math.max(8, top)}px`;
 }
 
+// mousemove 远比帧率频繁：只记下最后一次事件，每帧最多更新一次面板位置
+let hoverRafPending = false;
+let hoverLastEvent = null;
+
+function scheduleRankHoverPanelPosition(event){
+  hoverLastEvent = event;
+  if (hoverRafPending) return;
+  hoverRafPending = true;
+  requestAnimationFrame(()=>{
+    hoverRafPending = false;
+    if (rankHoverPanel.style.display !== 'block') return;
+    updateRankHoverPanelPosition(hoverLastEvent);
+  });
+}
+
 function showRankHoverPanel(r, event){
-  rankHoverPanel.innerHTML = `
-    <div><b>位置</b>：星系(${r.gx},${r.gy}) / 恒星系(${r.sx},${r.sy})</div>
-    <div><b>恒星</b>：${r.star_type}</div>
-    <div><b>组成</b>：${formatStats(r.planet_type_stats)}</div>
-    <div><b>总面积</b>：${r.overall_area}</div>
-    <div><b>平均矿物丰度</b>：${r.avg_mineral_density}</div>
-    <div><b>综合评分</b>：${r.score_v}</div>
-  `;
+  if (!rankHoverPanel.firstElementChild) rankHoverPanel.appendChild(tplRankHover.content.cloneNode(true));
+  fillFields(rankHoverPanel, {
+    location: `星系(${r.gx},${r.gy}) / 恒星系(${r.sx},${r.sy})`,
+    star_type: r.star_type,
+    stats: formatStats(r.planet_type_stats),
+    overall_area: numberFormat.format(r.overall_area),
+    avg_mineral_density: numberFormat.format(r.avg_mineral_density),
+    score_v: numberFormat.format(r.score_v),
+  });
   rankHoverPanel.style.display = 'block';
   updateRankHoverPanelPosition(event);
 }
@@ -1031,9 +1811,12 @@ function getMinNavWidth(){
 }
 
 function setNavWidth(px){
-  const rect = navView.getBoundingClientRect();
-  const minWidth = getMinNavWidth();
-  const maxWidth = Math.max(minWidth + 40, Math.floor(rect.width * 0.7));
+  applyNavWidth(px, getMinNavWidth(), navView.getBoundingClientRect().width);
+}
+
+// 只写不读：布局量由调用方提供，拖拽过程中不再每次 mousemove 都强制同步布局
+function applyNavWidth(px, minWidth, viewWidth){
+  const maxWidth = Math.max(minWidth + 40, Math.floor(viewWidth * 0.7));
   const next = Math.max(minWidth, Math.min(maxWidth, Math.floor(px)));
   navView.style.setProperty('--nav-width', `${next}px`);
 }
@@ -1044,24 +1827,30 @@ function autoFitNavWidth(){
 }
 
 function bindNavDividerDrag(){
-  let dragging = false;
+  // 拖拽开始时读取一次容器位置与最小宽度，拖拽期间复用
+  let dragRect = null;
+  let dragMinWidth = 0;
+  let resizeTimer = 0;
   navDivider.addEventListener('mousedown', (event)=>{
     event.preventDefault();
-    dragging = true;
+    dragRect = navView.getBoundingClientRect();
+    dragMinWidth = getMinNavWidth();
     navDivider.classList.add('dragging');
   });
   window.addEventListener('mousemove', (event)=>{
-    if (!dragging) return;
-    const rect = navView.getBoundingClientRect();
-    setNavWidth(event.clientX - rect.left);
+    if (!dragRect) return;
+    applyNavWidth(event.clientX - dragRect.left, dragMinWidth, dragRect.width);
   });
   window.addEventListener('mouseup', ()=>{
-    if (!dragging) return;
-    dragging = false;
+    if (!dragRect) return;
+    dragRect = null;
     navDivider.classList.remove('dragging');
   });
   navDivider.addEventListener('dblclick', autoFitNavWidth);
-  window.addEventListener('resize', ()=> setNavWidth(parseFloat(getComputedStyle(navView).getPropertyValue('--nav-width')) || 340));
+  window.addEventListener('resize', ()=>{
+    clearTimeout(resizeTimer);
+    resizeTimer = setTimeout(()=> setNavWidth(parseFloat(getComputedStyle(navView).getPropertyValue('--nav-width')) || 340), 100);
+  });
 }
 
 async function jumpToSystemFromRanking(r){
@@ -1074,40 +1863,97 @@ async function jumpToSystemFromRanking(r){
   state.desc = false;
   setSortOptions('planet');
   setSortIndicator();
-  renderInfo(await getJson(`${API}/system_info?gx=${r.gx}&gy=${r.gy}&sx=${r.sx}&sy=${r.sy}`));
+  renderInfo(await getJson(apiUrl('system_info', {gx: r.gx, gy: r.gy, sx: r.sx, sy: r.sy})));
   await loadList('');
 }
 
 async function loadRankings(){
   hideRankHoverPanel();
-  rankList.innerHTML = '<div class="hint">加载排行中...</div>';
-  const data = await getJson(`${API}/system_rankings?sort_key=${state.rank.sort_key}&desc=${state.rank.desc?1:0}&page=${state.rank.page}&page_size=${state.rank.page_size}`);
+  const cached = rankPageCache.has(rankPageKey(state.rank.page));
+  if (!rankNodes.size && !cached) rankList.innerHTML = '<div class="hint">加载排行中...</div>';
+  const data = await getRankPage(state.rank.page);
   state.rank.page = data.page;
   state.rank.total_pages = data.total_pages;
   rankPageInfo.textContent = `第 ${data.page}/${data.total_pages} 页 · 共 ${data.total} 个恒星系`;
   setRankSortIndicator();
 
-  rankList.innerHTML = '';
+  const nextNodes = new Map();
+  let anchor = rankList.firstChild;
+  // 连续的新增/移动行先收进 fragment，遇到原位保留的行时再一次性插到它前面
+  const pending = document.createDocumentFragment();
   data.rows.forEach((r, idx)=>{
-    const rankNo = (data.page - 1) * data.page_size + idx + 1;
-    const div = document.createElement('div');
-    div.className = 'node rank-node';
-    div.innerHTML = `
-      <div><b>#${rankNo}</b> <button class='rank-link-btn' data-gx='${r.gx}' data-gy='${r.gy}' data-sx='${r.sx}' data-sy='${r.sy}'>星系(${r.gx},${r.gy}) / 恒星系(${r.sx},${r.sy})</button> · ${r.star_type}</div>
-      <div class='rank-meta'>综合=${r.score_v} · 矿物稀疏度=${r.avg_mineral_density} · 总面积=${r.overall_area} · 行星数=${r.planet_count}</div>
-    `;
-    const titleBtn = div.querySelector('.rank-link-btn');
-    if (titleBtn) {
-      titleBtn.addEventListener('click', async (event)=>{
-        event.stopPropagation();
-        await jumpToSystemFromRanking(r);
-      });
+    const key = `${r.gx},${r.gy},${r.sx},${r.sy}`;
+    const div = rankNodes.get(key) || createRankNode(r);
+    div.rankRow = r;
+    div.querySelector('.rank-no').textContent = `#${(data.page - 1) * data.page_size + idx + 1}`;
+    nextNodes.set(key, div);
+    if (div === anchor) {
+      if (pending.firstChild) rankList.insertBefore(pending, anchor);
+      anchor = anchor.nextSibling;
+    } else {
+      pending.appendChild(div);
     }
-    div.addEventListener('mouseenter', (event)=> showRankHoverPanel(r, event));
-    div.addEventListener('mousemove', (event)=> updateRankHoverPanelPosition(event));
-    div.addEventListener('mouseleave', hideRankHoverPanel);
-    rankList.appendChild(div);
   });
+  if (anchor) {
+    // 剩余的旧行整段删除
+    const stale = document.createRange();
+    stale.setStartBefore(anchor);
+    stale.setEndAfter(rankList.lastChild);
+    stale.deleteContents();
+  }
+  rankList.appendChild(pending);
+  rankNodes = nextNodes;
+  // 后台预取下一页，点“下一页”时直接命中缓存
+  if (data.page < data.total_pages) getRankPage(data.page + 1).catch(()=>{});
+}
+
+function rankPageKey(page){
+  return `${state.rank.sort_key}|${state.rank.desc?1:0}|${page}|${state.rank.page_size}`;
+}
+
+function getRankPage(page){
+  const key = rankPageKey(page);
+  let pending = rankPageCache.get(key);
+  if (!pending) {
+    pending = getJson(apiUrl('system_rankings', {sort_key: state.rank.sort_key, desc: state.rank.desc?1:0, page, page_size: state.rank.page_size}));
+    pending.catch(()=> rankPageCache.delete(key));
+    rankPageCache.set(key, pending);
+  }
+  return pending;
+}
+
+function createRankNode(r){
+  return cloneTemplate(tplRankNode, {
+    location: `星系(${r.gx},${r.gy}) / 恒星系(${r.sx},${r.sy})`,
+    star_type: r.star_type,
+    score_v: numberFormat.format(r.score_v),
+    avg_mineral_density: numberFormat.format(r.avg_mineral_density),
+    overall_area: numberFormat.format(r.overall_area),
+    planet_count: r.planet_count,
+  }).firstElementChild;
+}
+
+// 列表与排行的行事件统一委托到容器上，行节点本身不挂监听
+function onListClick(event){
+  const node = event.target.closest('[data-idx]');
+  if (node) listRowClick(listRows[+node.dataset.idx]);
+}
+
+async function onRankClick(event){
+  const btn = event.target.closest('.rank-link-btn');
+  if (!btn) return;
+  event.stopPropagation();
+  await jumpToSystemFromRanking(btn.closest('.rank-node').rankRow);
+}
+
+function onRankMouseOver(event){
+  const node = event.target.closest('.rank-node');
+  if (node && !node.contains(event.relatedTarget)) showRankHoverPanel(node.rankRow, event);
+}
+
+function onRankMouseOut(event){
+  const node = event.target.closest('.rank-node');
+  if (node && !node.contains(event.relatedTarget)) hideRankHoverPanel();
 }
 
 async function jumpBySearch(){
@@ -1118,14 +1964,14 @@ async function jumpBySearch(){
   }
   const c = parseCoordInput(search);
   if (!c) {
-    list.innerHTML = '<div class="hint">请输入合法坐标，例如 12,34</div>';
+    showListHint('请输入合法坐标，例如 12,34');
     return;
   }
 
   if (state.level === 'galaxy') {
-    const r = await getJson(`${API}/galaxies?search=${encodeURIComponent(search)}`);
+    const r = await getJson(apiUrl('galaxies', {search}));
     if (!r.length) {
-      list.innerHTML = '<div class="hint">未找到该星系</div>';
+      showListHint('未找到该星系');
       return;
     }
     state.level = 'system';
@@ -1134,15 +1980,15 @@ async function jumpBySearch(){
     state.desc = false;
     setSortIndicator();
     setSortOptions('system');
-    renderInfo(await getJson(`${API}/galaxy_info?gx=${c.x}&gy=${c.y}`));
+    renderInfo(await getJson(apiUrl('galaxy_info', {gx: c.x, gy: c.y})));
     await loadList('');
     return;
   }
 
   if (state.level === 'system') {
-    const r = await getJson(`${API}/systems?gx=${state.gx}&gy=${state.gy}&search=${encodeURIComponent(search)}`);
+    const r = await getJson(apiUrl('systems', {gx: state.gx, gy: state.gy, search}));
     if (!r.length) {
-      list.innerHTML = '<div class="hint">未找到该恒星系</div>';
+      showListHint('未找到该恒星系');
       return;
     }
     state.level = 'planet';
@@ -1151,7 +1997,7 @@ async function jumpBySearch(){
     state.desc = false;
     setSortIndicator();
     setSortOptions('planet');
-    renderInfo(await getJson(`${API}/system_info?gx=${state.gx}&gy=${state.gy}&sx=${c.x}&sy=${c.y}`));
+    renderInfo(await getJson(apiUrl('system_info', {gx: state.gx, gy: state.gy, sx: c.x, sy: c.y})));
     await loadList('');
     return;
   }
@@ -1159,20 +2005,46 @@ async function jumpBySearch(){
   await loadList('');
 }
 
+// 页面在后台时暂停轮询，回到前台再继续
+function waitVisible(){
+  if (!document.hidden) return Promise.resolve();
+  return new Promise(resolve => {
+    const onChange = ()=>{
+      if (document.hidden) return;
+      document.removeEventListener('visibilitychange', onChange);
+      resolve();
+    };
+    document.addEventListener('visibilitychange', onChange);
+  });
+}
+
 async function init() {
   bindNavDividerDrag();
+  navSide.addEventListener('scroll', renderListWindow, { passive: true });
+  list.addEventListener('click', onListClick);
+  rankList.addEventListener('click', onRankClick);
+  rankList.addEventListener('mouseover', onRankMouseOver);
+  rankList.addEventListener('mouseout', onRankMouseOut);
+  rankList.addEventListener('mousemove', scheduleRankHoverPanelPosition);
+  window.addEventListener('resize', renderListWindow);
   autoFitNavWidth();
 
   if (!forceReady) {
     const loadingStart = Date.now();
     const MIN_LOADING_MS = 1500;
     let sawPreloading = false;
+    // 轮询间隔从 150ms 指数退避到 1s；进度未变时不写 DOM
+    let pollDelay = 150;
+    let lastStatsText = '';
+    let lastBarWidth = '';
     while (true) {
       const status = await getJson(`${API}/preload_status`);
       const pct = status.progress_percent || 0;
       if (status.preloading || !status.ready) sawPreloading = true;
-      loadingStats.textContent = `进度 ${pct}% (${status.rows_done}/${status.rows_total}) · 星系: ${status.galaxy_count} · 恒星系: ${status.system_count} · 行星: ${status.planet_count}`;
-      loadingBar.style.width = `${Math.max(4, pct)}%`;
+      const statsText = `进度 ${pct}% (${status.rows_done}/${status.rows_total}) · 星系: ${status.galaxy_count} · 恒星系: ${status.system_count} · 行星: ${status.planet_count}`;
+      const barWidth = `${Math.max(4, pct)}%`;
+      if (statsText !== lastStatsText) loadingStats.textContent = lastStatsText = statsText;
+      if (barWidth !== lastBarWidth) loadingBar.style.width = lastBarWidth = barWidth;
       const elapsed = Date.now() - loadingStart;
       const canEnter = status.ready && elapsed >= MIN_LOADING_MS && (sawPreloading || pct >= 100);
       if (canEnter) {
@@ -1181,7 +2053,9 @@ async function init() {
         info.innerHTML = `<b>已加载</b><br>星系: ${status.galaxy_count} · 恒星系: ${status.system_count} · 行星: ${status.planet_count}`;
         break;
       }
-      await new Promise(r => setTimeout(r, 300));
+      await new Promise(r => setTimeout(r, pollDelay));
+      pollDelay = Math.min(1000, pollDelay * 1.3);
+      await waitVisible();
     }
   } else {
     loadingOverlay.style.display = 'none';
@@ -1192,11 +2066,6 @@ async function init() {
 
   setSortOptions('galaxy');
   setSortIndicator();
-  rankSortKey.innerHTML = `
-    <fluent-option value="score_v">综合</fluent-option>
-    <fluent-option value="avg_mineral_density">矿物稀疏度</fluent-option>
-    <fluent-option value="overall_area">总面积</fluent-option>
-  `;
   rankSortKey.value = state.rank.sort_key;
   setRankSortIndicator();
   await loadList('');
@@ -1228,7 +2097,7 @@ document.getElementById('backBtn').onclick = async ()=>{
     state.level = 'system';
     state.sort_key = 'x';
     setSortOptions('system');
-    renderInfo(await getJson(`${API}/galaxy_info?gx=${state.gx}&gy=${state.gy}`));
+    renderInfo(await getJson(apiUrl('galaxy_info', {gx: state.gx, gy: state.gy})));
   } else if (state.level === 'system') {
     state.level = 'galaxy';
     state.gx = null; state.gy = null;
@@ -1277,6 +2146,13 @@ document.getElementById('rankNext').onclick = async ()=>{
   await loadRankings();
 };
 
+// 鼠标移到翻页按钮上就开始取目标页，点击时请求多半已在途或已完成（下一页在渲染后已预取，这里主要补上一页）
+function prefetchRankPage(page){
+  if (page >= 1 && page <= state.rank.total_pages) getRankPage(page).catch(()=>{});
+}
+document.getElementById('rankPrev').addEventListener('mouseenter', ()=> prefetchRankPage(state.rank.page - 1));
+document.getElementById('rankNext').addEventListener('mouseenter', ()=> prefetchRankPage(state.rank.page + 1));
+
 init();
 </script>
 </body>
@@ -1333,100 +2209,199 @@ poll();
 """
 
 
+def _static_page(html: str) -> Tuple[bytes, bytes, str]:
+    """页面是模块常量：UTF-8 编码、gzip 压缩结果与 ETag 在导入时算好，请求时直接写出。"""
+    raw = html.encode("utf-8")
+    return raw, gzip.compress(raw, compresslevel=9), f'"{hashlib.sha1(raw).hexdigest()[:16]}"'
+
+
+HTML_PAGE = _static_page(HTML)
+LOADING_HTML_PAGE = _static_page(LOADING_HTML)
+
+
+def json_bytes(data: object) -> bytes:
+    """接口响应编码为 UTF-8 JSON；装有 orjson 时直接在 C 里序列化成 bytes。"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
 class AppHTTP(BaseHTTPRequestHandler):
     service = UniverseService()
+    # HTTP/1.1 默认保持连接：所有响应都经 _send 带 Content-Length，前端连续的小请求可复用同一 TCP 连接
+    protocol_version = "HTTP/1.1"
+    # 响应头与正文先写进缓冲、处理完一次 flush，通常一次 send 发出；再关掉 Nagle：
+    # 否则长连接上“头、正文”两个小包中的后一个要等客户端延迟 ACK（约 40ms）才发出
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    LIST_MAX_PAGE_SIZE = 200
+    GZIP_MIN_BYTES = 1024
+    # 除 preload_status 外的接口都先等预加载完成，之后响应只由 path + 查询串决定：
+    # 编码好的正文（及其 gzip）按此缓存，重复请求（返回上一级、来回切换排序）直接写出，不再排序/序列化/压缩
+    BODY_CACHE_SIZE = 1024
+    UNCACHED_PATHS = frozenset({"/", "/loading", "/api/preload_status"})
+    _body_cache: Dict[Tuple[str, str], Tuple[bytes, Optional[bytes]]] = {}
+    _body_cache_lock = threading.Lock()
+
+    def _json_rows(self, rows: List[Dict[str, object]], params: Dict[str, str]) -> None:
+        """列表接口：带 page_size 时按页返回（结构同 system_rankings），否则返回完整数组。"""
+        if "page_size" not in params:
+            self._json(rows)
+            return
+        self._json(
+            self.service.paginate(rows, int(params.get("page", "1")), int(params["page_size"]), max_page_size=self.LIST_MAX_PAGE_SIZE)
+        )
 
     def _json(self, data: object, status: int = 200) -> None:
-        raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Content-Length", str(len(raw)))
-        self.end_headers()
-        self.wfile.write(raw)
+        raw = json_bytes(data)
+        if status != 200 or self._cache_key is None:
+            self._send(raw, "application/json; charset=utf-8", status)
+            return
+        gzipped = gzip.compress(raw, compresslevel=1) if len(raw) > self.GZIP_MIN_BYTES else None
+        with self._body_cache_lock:
+            cache = self._body_cache
+            if len(cache) >= self.BODY_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[self._cache_key] = (raw, gzipped)
+        self._send(raw, "application/json; charset=utf-8", status, gzipped=gzipped)
+
+    def _html(self, page: Tuple[bytes, bytes, str]) -> None:
+        raw, gzipped, etag = page
+        # 页面随程序版本变化，不能长期强缓存：带 ETag 让浏览器每次校验，未变化时回 304 不再传输正文
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self._send(raw, "text/html; charset=utf-8", 200, gzipped=gzipped, headers={"ETag": etag, "Cache-Control": "no-cache"})
 
-    def _html(self, data: str, status: int = 200) -> None:
-        raw = data.encode("utf-8")
+    def _send(
+        self,
+        raw: bytes,
+        content_type: str,
+        status: int,
+        gzipped: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        # 较大的响应在客户端接受时用 gzip（压缩级别 1）传输，字段名大量重复，压缩率很高；静态页面传入预先压缩好的 gzipped
+        use_gzip = len(raw) > self.GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", "")
+        if use_gzip:
+            raw = gzipped if gzipped is not None else gzip.compress(raw, compresslevel=1)
         self.send_response(status)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Type", content_type)
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.send_header("Content-Length", str(len(raw)))
         self.end_headers()
         self.wfile.write(raw)
 
+    def _page_index(self, params: Dict[str, str]) -> None:
+        self.service.ensure_preload_started()
+        self._html(HTML_PAGE)
+
+    def _page_loading(self, params: Dict[str, str]) -> None:
+        self.service.ensure_preload_started()
+        self._html(LOADING_HTML_PAGE)
+
+    def _api_preload_status(self, params: Dict[str, str]) -> None:
+        self.service.ensure_preload_started()
+        self._json(self.service.preload_status())
+
+    def _api_app_info(self, params: Dict[str, str]) -> None:
+        self._json(self.service.app_info())
+
+    def _api_galaxies(self, params: Dict[str, str]) -> None:
+        self._json_rows(
+            self.service.list_galaxies(
+                sort_key=params.get("sort_key", "x"),
+                desc=params.get("desc", "0") == "1",
+                search=params.get("search", ""),
+            ),
+            params,
+        )
+
+    def _api_galaxy_info(self, params: Dict[str, str]) -> None:
+        self._json(self.service.galaxy_info(int(params["gx"]), int(params["gy"])))
+
+    def _api_systems(self, params: Dict[str, str]) -> None:
+        self._json_rows(
+            self.service.list_systems(
+                int(params["gx"]),
+                int(params["gy"]),
+                sort_key=params.get("sort_key", "x"),
+                desc=params.get("desc", "0") == "1",
+                search=params.get("search", ""),
+            ),
+            params,
+        )
+
+    def _api_system_info(self, params: Dict[str, str]) -> None:
+        self._json(self.service.system_info(int(params["gx"]), int(params["gy"]), int(params["sx"]), int(params["sy"])))
+
+    def _api_planets(self, params: Dict[str, str]) -> None:
+        self._json_rows(
+            self.service.list_planets(
+                int(params["gx"]),
+                int(params["gy"]),
+                int(params["sx"]),
+                int(params["sy"]),
+                sort_key=params.get("sort_key", "planet_x"),
+                desc=params.get("desc", "0") == "1",
+            ),
+            params,
+        )
+
+    def _api_planet(self, params: Dict[str, str]) -> None:
+        self._json(self.service.planet_info(params["map_key"]))
+
+    def _api_system_rankings(self, params: Dict[str, str]) -> None:
+        desc_value = params.get("desc")
+        desc = None if desc_value is None else desc_value == "1"
+        self._json(
+            self.service.list_system_rankings(
+                sort_key=params.get("sort_key", "overall_area"),
+                desc=desc,
+                page=int(params.get("page", "1")),
+                page_size=int(params.get("page_size", "25")),
+            )
+        )
+
+    # 路径 → 处理函数（类体内的普通函数，调用时显式传入 self）
+    ROUTES: Dict[str, Callable[["AppHTTP", Dict[str, str]], None]] = {
+        "/": _page_index,
+        "/loading": _page_loading,
+        "/api/preload_status": _api_preload_status,
+        "/api/app_info": _api_app_info,
+        "/api/galaxies": _api_galaxies,
+        "/api/galaxy_info": _api_galaxy_info,
+        "/api/systems": _api_systems,
+        "/api/system_info": _api_system_info,
+        "/api/planets": _api_planets,
+        "/api/planet": _api_planet,
+        "/api/system_rankings": _api_system_rankings,
+    }
+
     def do_GET(self) -> None:  # noqa: N802
         path, _, query = self.path.partition("?")
+        # 同一连接上的多个请求共用一个 handler 实例，缓存键每次都要重新赋值
+        self._cache_key = None if path in self.UNCACHED_PATHS else (path, query)
+        if self._cache_key is not None:
+            cached = self._body_cache.get(self._cache_key)
+            if cached is not None:
+                self._send(cached[0], "application/json; charset=utf-8", 200, gzipped=cached[1])
+                return
         params_raw = parse_qs(query, keep_blank_values=True)
         params = {k: unquote(v[0]) for k, v in params_raw.items() if v}
 
-        try:
-            if path == "/":
-                self.service.ensure_preload_started()
-                self._html(HTML)
-                return
-            if path == "/loading":
-                self.service.ensure_preload_started()
-                self._html(LOADING_HTML)
-                return
-            if path == "/api/preload_status":
-                self.service.ensure_preload_started()
-                self._json(self.service.preload_status())
-                return
-            if path == "/api/app_info":
-                self._json(self.service.app_info())
-                return
-            if path == "/api/galaxies":
-                self._json(
-                    self.service.list_galaxies(
-                        sort_key=params.get("sort_key", "x"),
-                        desc=params.get("desc", "0") == "1",
-                        search=params.get("search", ""),
-                    )
-                )
-                return
-            if path == "/api/galaxy_info":
-                self._json(self.service.galaxy_info(int(params["gx"]), int(params["gy"])))
-                return
-            if path == "/api/systems":
-                self._json(
-                    self.service.list_systems(
-                        int(params["gx"]),
-                        int(params["gy"]),
-                        sort_key=params.get("sort_key", "x"),
-                        desc=params.get("desc", "0") == "1",
-                        search=params.get("search", ""),
-                    )
-                )
-                return
-            if path == "/api/system_info":
-                self._json(self.service.system_info(int(params["gx"]), int(params["gy"]), int(params["sx"]), int(params["sy"])))
-                return
-            if path == "/api/planets":
-                self._json(
-                    self.service.list_planets(
-                        int(params["gx"]),
-                        int(params["gy"]),
-                        int(params["sx"]),
-                        int(params["sy"]),
-                        sort_key=params.get("sort_key", "planet_x"),
-                        desc=params.get("desc", "0") == "1",
-                    )
-                )
-                return
-            if path == "/api/planet":
-                self._json(self.service.planet_info(params["map_key"]))
-                return
-            if path == "/api/system_rankings":
-                desc_value = params.get("desc")
-                desc = None if desc_value is None else desc_value == "1"
-                self._json(
-                    self.service.list_system_rankings(
-                        sort_key=params.get("sort_key", "overall_area"),
-                        desc=desc,
-                        page=int(params.get("page", "1")),
-                        page_size=int(params.get("page_size", "25")),
-                    )
-                )
-                return
+        handler = self.ROUTES.get(path)
+        if handler is None:
             self._json({"error": "not found"}, status=404)
+            return
+        try:
+            handler(self, params)
         except Exception as e:
             self._json({"error": str(e)}, status=400)
 
@@ -1546,6 +2521,7 @@ def run_app() -> None:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     if not os.environ.get("DISPLAY") and os.name != "nt":
         verify_samples()
         AppHTTP.service.ensure_preload_started()